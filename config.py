@@ -8,59 +8,86 @@
 """
 
 import os
+import re
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+# Matches one KEY=value assignment per line; the value is captured in group 2
+# (double-quoted), 3 (single-quoted) or 4 (bare). Comments and blank lines
+# never match because the key must start with a letter or underscore.
+ENV_LINE_PATTERN = re.compile(
+    r'^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*'
+    r'(?:"([^"\n]*)"|\'([^\'\n]*)\'|(.*?))[ \t\r]*$',
+    re.M
+)
+
 class ConfigManager:
     """Centralized configuration manager"""
     
     def __init__(self, env_file: Optional[Path] = None):
         self.env_file = env_file or Path(__file__).parent / ".env"
         self.config = {}
+        self._cache: Dict[tuple, Any] = {}
         self.load_config()
     
     def load_config(self):
         """Load configuration from .env file"""
-        if not self.env_file.exists():
-            return
+        self._cache.clear()
+        text = self._read_env_file()
+        
+        parsed = {}
+        for match in ENV_LINE_PATTERN.finditer(text):
+            key = match.group(1)
+            value = next(v for v in match.group(2, 3, 4) if v is not None)
+            
+            # Convert numeric strings, then boolean strings
+            try:
+                value = int(value)
+            except ValueError:
+                lowered = value.lower()
+                if lowered == 'true':
+                    value = True
+                elif lowered == 'false':
+                    value = False
+            
+            parsed[key] = value
         
-        with open(self.env_file, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    
-                    # Remove quotes if present
-                    if value.startswith('"') and value.endswith('"'):
-                        value = value[1:-1]
-                    elif value.startswith("'") and value.endswith("'"):
-                        value = value[1:-1]
-                    
-                    # Convert boolean strings
-                    if value.lower() in ('true', 'false'):
-                        value = value.lower() == 'true'
-                    
-                    # Convert numeric strings
-                    elif value.isdigit():
-                        value = int(value)
-                    
-                    self.config[key] = value
-                    # Also set as environment variable
-                    os.environ[key] = str(value)
+        self.config.update(parsed)
+        # Also export to the environment in one batch for child processes
+        os.environ.update({key: str(value) for key, value in parsed.items()})
+    
+    def _read_env_file(self) -> str:
+        """Return the .env contents, or an empty string if it is missing"""
+        try:
+            return self.env_file.read_text(encoding='utf-8')
+        except FileNotFoundError:
+            return ''
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value"""
         return self.config.get(key, default)
     
+    def _memoize(self, cache_key: tuple, compute) -> Any:
+        """Return a cached result, computing it on first access"""
+        try:
+            return self._cache[cache_key]
+        except KeyError:
+            result = self._cache[cache_key] = compute()
+            return result
+    
     def get_int(self, key: str, default: int = 0) -> int:
         """Get integer configuration value"""
+        return self._memoize(('int', key, default), lambda: self._to_int(key, default))
+    
+    def _to_int(self, key: str, default: int) -> int:
         value = self.get(key, default)
         return int(value) if value is not None else default
     
     def get_bool(self, key: str, default: bool = False) -> bool:
         """Get boolean configuration value"""
+        return self._memoize(('bool', key, default), lambda: self._to_bool(key, default))
+    
+    def _to_bool(self, key: str, default: bool) -> bool:
         value = self.get(key, default)
         if isinstance(value, bool):
             return value
@@ -73,89 +100,83 @@ def get_list(self, key: str, separator: str = ',', default: list = None) -> list
         value = self.get(key, '')
         if not value:
             return default or []
-        return [item.strip() for item in str(value).split(separator)]
+        items = self._memoize(
+            ('list', key, separator),
+            lambda: tuple(item.strip() for item in str(value).split(separator))
+        )
+        return list(items)
     
     def update(self, key: str, value: Any):
         """Update configuration value"""
-        self.config[key] = value
-        os.environ[key] = str(value)
+        self.set_many({key: value})
+    
+    def set_many(self, values: Dict[str, Any]):
+        """Update several configuration values at once"""
+        self._cache.clear()
+        self.config.update(values)
+        os.environ.update({key: str(value) for key, value in values.items()})
     
     def save_config(self):
         """Save current configuration back to .env file"""
-        lines = []
-        
-        # Read existing file to preserve comments and order
-        if self.env_file.exists():
-            with open(self.env_file, 'r') as f:
-                for line in f:
-                    line_strip = line.strip()
-                    if line_strip and not line_strip.startswith('#') and '=' in line_strip:
-                        key = line_strip.split('=', 1)[0].strip()
-                        if key in self.config:
-                            # Update with new value
-                            value = self.config[key]
-                            if isinstance(value, str) and (' ' in value or not value):
-                                lines.append(f"{key}={value}\n")
-                            else:
-                                lines.append(f"{key}={value}\n")
-                        else:
-                            lines.append(line)
-                    else:
-                        lines.append(line)
+        text = self._read_env_file()
         
-        # Add new keys that weren't in the original file
+        # Rewrite existing assignments in place to preserve comments and order
+        parts = []
         existing_keys = set()
-        for line in lines:
-            line_strip = line.strip()
-            if line_strip and not line_strip.startswith('#') and '=' in line_strip:
-                key = line_strip.split('=', 1)[0].strip()
-                existing_keys.add(key)
+        position = 0
+        for match in ENV_LINE_PATTERN.finditer(text):
+            key = match.group(1)
+            existing_keys.add(key)
+            if key in self.config:
+                parts.append(text[position:match.start()])
+                parts.append(f"{key}={self.config[key]}")
+                position = match.end()
+        parts.append(text[position:])
         
-        for key, value in self.config.items():
-            if key not in existing_keys:
-                if isinstance(value, str) and (' ' in value or not value):
-                    lines.append(f"{key}={value}\n")
-                else:
-                    lines.append(f"{key}={value}\n")
+        # Add new keys that weren't in the original file
+        new_lines = [f"{key}={value}\n" for key, value in self.config.items()
+                     if key not in existing_keys]
+        if new_lines and text and not text.endswith('\n'):
+            parts.append('\n')
+        parts.extend(new_lines)
         
         # Write back to file
-        with open(self.env_file, 'w') as f:
-            f.writelines(lines)
+        self.env_file.write_text(''.join(parts), encoding='utf-8')
     
     def get_flask_config(self) -> Dict[str, Any]:
         """Get Flask-specific configuration"""
-        return {
+        return dict(self._memoize(('flask_config',), lambda: {
             'port': self.get_int('FLASK_APP_PORT', 6767),
             'host': self.get('FLASK_APP_HOST', '0.0.0.0'),
             'debug': self.get_bool('FLASK_DEBUG', True),
             'secret_key': self.get('SECRET_KEY', 'dev-secret-key'),
             'database_url': self.get('DATABASE_URL', 'sqlite:///instance/nasa_space_app.db')
-        }
+        }))
     
     def get_team_website_config(self) -> Dict[str, Any]:
         """Get team website configuration"""
-        return {
+        return dict(self._memoize(('team_website_config',), lambda: {
             'port': self.get_int('TEAM_WEBSITE_PORT', 8080),
             'host': self.get('TEAM_WEBSITE_HOST', '0.0.0.0'),
             'debug': self.get_bool('FLASK_DEBUG', True),
             'title': self.get('TEAM_WEBSITE_TITLE', 'TerraPulse'),
             'tagline': self.get('TEAM_WEBSITE_TAGLINE', 'NASA Space Apps Challenge')
-        }
+        }))
     
     def get_jupyter_config(self) -> Dict[str, Any]:
         """Get Jupyter configuration"""
-        return {
+        return dict(self._memoize(('jupyter_config',), lambda: {
             'port': self.get_int('JUPYTER_PORT', 8888),
             'host': self.get('JUPYTER_HOST', 'localhost')
-        }
+        }))
     
     def get_nginx_config(self) -> Dict[str, Any]:
         """Get Nginx configuration"""
-        return {
+        return dict(self._memoize(('nginx_config',), lambda: {
             'proxy_port': self.get_int('NGINX_PROXY_PORT', 80),
             'flask_port': self.get_int('FLASK_APP_PORT', 6767),
             'team_port': self.get_int('TEAM_WEBSITE_PORT', 8080)
-        }
+        }))
     
     def show_config_summary(self):
         """Display configuration summary"""
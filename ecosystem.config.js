@@ -2,7 +2,8 @@ module.exports = {
   apps: [
     {
       name: 'nasa-space-app',
-      script: 'app.py',
+      script: '/home/raju/nasa_space_app/flask-app/venv/bin/gunicorn',
+      args: "-c gunicorn.conf.py 'app:create_app()'",
       cwd: '/home/raju/nasa_space_app/flask-app',
       interpreter: '/home/raju/nasa_space_app/flask-app/venv/bin/python',
       instances: 1,
@@ -3,28 +3,29 @@ def delete_applications(self, app='all'):
         Logger.section("Deleting NASA Space App Applications")
         
         # Define our specific applications to avoid deleting others
-        if app == 'all':
-            apps_to_delete = ['nasa-space-app', 'terrapulse-team-website']
-        elif app == 'flask':
-            apps_to_delete = ['nasa-space-app']
-        elif app == 'team':
-            apps_to_delete = ['terrapulse-team-website']
-        else:
-            apps_to_delete = []
+        apps_to_delete = _APP_GROUPS.get(app, ())
         
         success = True
         results = []
         
-        for app_name in apps_to_delete:
-            Logger.info(f"Deleting {app_name}...")
-            result = subprocess.run(["pm2", "delete", app_name], capture_output=True, text=True)
-            
+        # Each `pm2 delete` spawns a Node process, so run them concurrently
+        with ThreadPoolExecutor(max_workers=max(len(apps_to_delete), 1)) as executor:
+            futures = {}
+            for app_name in apps_to_delete:
+                Logger.info(f"Deleting {app_name}...")
+                future = executor.submit(
+                    subprocess.run, ["pm2", "delete", app_name], capture_output=True, text=True
+                )
+                futures[future] = app_name
+            completed = [(futures[future], future.result()) for future in as_completed(futures)]
+        
+        for app_name, result in completed:
             if result.returncode == 0:
                 Logger.success(f"✅ {app_name} deleted successfully")
                 results.append(f"{app_name}: deleted")
             else:
                 # Check if the app doesn't exist (which is not an error)
-                if "Process or Namespace" in result.stderr and "not found" in result.stderr:
+                if _NOT_FOUND_RE.search(result.stderr):
                     Logger.info(f"ℹ️  {app_name} was not running (already deleted)")
                     results.append(f"{app_name}: not found")
                 else:
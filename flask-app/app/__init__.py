@@ -1,33 +1,59 @@
-from flask import Flask
-from flask_cors import CORS
+from flask import Flask, g, request, make_response
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
 from flask_marshmallow import Marshmallow
 import os
 from dotenv import load_dotenv
 
+# Load environment variables once at import; create_app() reuses them.
+# Child processes (e.g. the debug reloader) inherit the loaded values, so
+# the marker lets them skip the .env directory walk.
+if not os.environ.get('_DOTENV_LOADED'):
+    load_dotenv()
+    os.environ['_DOTENV_LOADED'] = '1'
+
+SECRET_KEY = os.getenv('SECRET_KEY', 'dev-secret-key-change-in-production')
+DATABASE_URL = os.getenv('DATABASE_URL')
+FLASK_ENV_IS_DEV = os.getenv('FLASK_ENV') == 'development'
+AUTO_CREATE_TABLES = os.getenv('AUTO_CREATE_TABLES', '1') == '1'
+
+# CORS: comma-separated allowlist; empty means any origin is echoed back
+CORS_ORIGINS = frozenset(
+    origin.strip() for origin in os.getenv('CORS_ORIGINS', '').split(',') if origin.strip()
+)
+_CORS_STATIC_HEADERS = {
+    'Access-Control-Allow-Credentials': 'true',
+    'Access-Control-Allow-Methods': 'GET, POST, PUT, PATCH, DELETE, OPTIONS',
+    'Access-Control-Allow-Headers': 'Content-Type, Authorization, X-Requested-With',
+    'Access-Control-Max-Age': '86400',
+}
+
 # Initialize extensions
 db = SQLAlchemy()
 migrate = Migrate()
 ma = Marshmallow()
 
+# Database URIs whose tables have already been created in this process
+_tables_created = set()
+
 def create_app(config_name='development'):
     """Application factory pattern"""
     
-    # Load environment variables
-    load_dotenv()
-    
     # Create Flask app
     app = Flask(__name__)
     
+    # Encode JSON responses with orjson (datetimes, UUIDs, numpy in C)
+    from app.utils.helpers import OrjsonProvider
+    app.json = OrjsonProvider(app)
+    
     # Configuration
-    app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'dev-secret-key-change-in-production')
-    app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv(
-        'DATABASE_URL', 
+    app.config['SECRET_KEY'] = SECRET_KEY
+    app.config['SQLALCHEMY_DATABASE_URI'] = DATABASE_URL or (
         'sqlite:///' + os.path.join(app.instance_path, 'nasa_space_app.db')
     )
+    # Nothing subscribes to Flask-SQLAlchemy's model signals; keep tracking off
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-    app.config['SQLALCHEMY_ECHO'] = os.getenv('FLASK_ENV') == 'development'
+    app.config['SQLALCHEMY_ECHO'] = FLASK_ENV_IS_DEV
     
     # Session configuration for proper cookie handling
     app.config['SESSION_COOKIE_SAMESITE'] = 'Lax'
@@ -45,7 +71,26 @@ def create_app(config_name='development'):
     db.init_app(app)
     migrate.init_app(app, db)
     ma.init_app(app)
-    CORS(app, supports_credentials=True, resources={r"/*": {"origins": "*"}})
+    
+    # CORS headers are built once above; only the Origin echo is per request
+    @app.before_request
+    def handle_cors_preflight():
+        if request.method == 'OPTIONS' and 'Access-Control-Request-Method' in request.headers:
+            return make_response('', 204)
+    
+    @app.after_request
+    def add_cors_headers(response):
+        origin = request.headers.get('Origin')
+        if origin and (not CORS_ORIGINS or origin in CORS_ORIGINS):
+            response.headers.update(_CORS_STATIC_HEADERS)
+            response.headers['Access-Control-Allow-Origin'] = origin
+            response.vary.add('Origin')
+            # Preflights may ask for any header, as flask-cors allowed
+            requested_headers = request.headers.get('Access-Control-Request-Headers')
+            if requested_headers:
+                response.headers['Access-Control-Allow-Headers'] = requested_headers
+                response.vary.add('Access-Control-Request-Headers')
+        return response
     
     # Register blueprints
     from app.routes.main_routes import main_bp
@@ -65,17 +110,23 @@ def create_app(config_name='development'):
     app.register_blueprint(ml_routes)
     
     # Context processor to make user data available to all templates
+    # (resolved once per request and reused by every template rendered in it)
     @app.context_processor
     def inject_user():
-        from app.routes.auth_routes import get_current_user
-        try:
-            user = get_current_user()
-            return dict(user=user)
-        except:
-            return dict(user=None)
+        if '_current_user' not in g:
+            from app.routes.auth_routes import get_current_user
+            try:
+                g._current_user = get_current_user()
+            except:
+                g._current_user = None
+        return dict(user=g._current_user)
     
-    # Create database tables
-    with app.app_context():
-        db.create_all()
+    # Create database tables once per database per process; set
+    # AUTO_CREATE_TABLES=0 to rely on Flask-Migrate exclusively
+    database_uri = app.config['SQLALCHEMY_DATABASE_URI']
+    if AUTO_CREATE_TABLES and database_uri not in _tables_created:
+        with app.app_context():
+            db.create_all()
+        _tables_created.add(database_uri)
     
     return app
\ No newline at end of file
@@ -1,6 +1,7 @@
 from app import db, ma
 from datetime import datetime
-from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import deferred
 
 # Import user models
 from .user import User, UserSession, OnboardingProgress
@@ -13,7 +14,7 @@ class Mission(db.Model):
     name = db.Column(db.String(100), nullable=False, unique=True)
     description = db.Column(db.Text)
     launch_date = db.Column(db.Date)
-    status = db.Column(db.String(50), default='Active')
+    status = db.Column(db.String(50), default='Active', index=True)
     mission_type = db.Column(db.String(50))  # e.g., 'Earth Observation', 'Mars', 'ISS'
     agency = db.Column(db.String(50), default='NASA')
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
@@ -30,17 +31,26 @@ def to_dict(self):
             'id': self.id,
             'name': self.name,
             'description': self.description,
-            'launch_date': self.launch_date.isoformat() if self.launch_date else None,
+            'launch_date': self.launch_date,
             'status': self.status,
             'mission_type': self.mission_type,
             'agency': self.agency,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat()
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
         }
 
 class DataRecord(db.Model):
     """Data records from NASA missions"""
     __tablename__ = 'data_records'
+    __table_args__ = (
+        db.Index('ix_data_records_mission_ts', 'mission_id', 'timestamp'),
+        db.Index('ix_data_records_timestamp', 'timestamp'),
+        # Bounding-box lookups: range scan on latitude, longitude checked in-index
+        db.Index('ix_data_records_lat_lon', 'latitude', 'longitude'),
+        # Containment/key lookups on PostgreSQL; other backends skip it
+        db.Index('ix_data_records_values_gin', 'data_values',
+                 postgresql_using='gin').ddl_if(dialect='postgresql'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     mission_id = db.Column(db.Integer, db.ForeignKey('missions.id'), nullable=False)
@@ -50,7 +60,8 @@ class DataRecord(db.Model):
     latitude = db.Column(db.Float)
     longitude = db.Column(db.Float)
     altitude = db.Column(db.Float)
-    data_values = db.Column(db.JSON)  # Store JSON data
+    # Store JSON data; deferred so listings don't decode every payload
+    data_values = deferred(db.Column(db.JSON().with_variant(JSONB(), 'postgresql')))
     file_path = db.Column(db.String(255))
     file_size = db.Column(db.Integer)
     checksum = db.Column(db.String(64))
@@ -59,25 +70,28 @@ class DataRecord(db.Model):
     def __repr__(self):
         return f'<DataRecord {self.id} - {self.record_type}>'
     
-    def to_dict(self):
-        return {
+    def to_dict(self, include_values=True):
+        data = {
             'id': self.id,
             'mission_id': self.mission_id,
             'record_type': self.record_type,
             'data_source': self.data_source,
-            'timestamp': self.timestamp.isoformat(),
+            'timestamp': self.timestamp,
             'latitude': self.latitude,
             'longitude': self.longitude,
             'altitude': self.altitude,
-            'data_values': self.data_values,
             'file_path': self.file_path,
             'file_size': self.file_size,
-            'created_at': self.created_at.isoformat()
+            'created_at': self.created_at
         }
+        if include_values:
+            data['data_values'] = self.data_values
+        return data
 
 class Spacecraft(db.Model):
     """Spacecraft/Satellite model"""
     __tablename__ = 'spacecraft'
+    __table_args__ = (db.Index('ix_spacecraft_mission_id', 'mission_id'),)
     
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False, unique=True)
@@ -103,12 +117,12 @@ def to_dict(self):
             'mission_id': self.mission_id,
             'spacecraft_type': self.spacecraft_type,
             'status': self.status,
-            'launch_date': self.launch_date.isoformat() if self.launch_date else None,
+            'launch_date': self.launch_date,
             'mass': self.mass,
             'power': self.power,
             'orbit_type': self.orbit_type,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat()
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
         }
 
 # Marshmallow Schemas for serialization
@@ -124,6 +138,11 @@ class Meta:
         load_instance = True
         include_relationships = True
 
+class DataRecordSummarySchema(DataRecordSchema):
+    """Data record without its (deferred) JSON payload, for listings"""
+    class Meta(DataRecordSchema.Meta):
+        exclude = ('data_values',)
+
 class SpacecraftSchema(ma.SQLAlchemyAutoSchema):
     class Meta:
         model = Spacecraft
@@ -135,5 +154,6 @@ class Meta:
 missions_schema = MissionSchema(many=True)
 data_record_schema = DataRecordSchema()
 data_records_schema = DataRecordSchema(many=True)
+data_record_summaries_schema = DataRecordSummarySchema(many=True)
 spacecraft_schema = SpacecraftSchema()
 spacecrafts_schema = SpacecraftSchema(many=True)
\ No newline at end of file
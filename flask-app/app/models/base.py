@@ -0,0 +1,14 @@
+from functools import lru_cache
+from sqlalchemy import inspect
+
+
+@lru_cache(maxsize=None)
+def mapped_attribute_names(model):
+    """Names of a model's mapped columns and relationships, computed once"""
+    return frozenset(inspect(model).attrs.keys())
+
+
+def set_known_attributes(instance, values):
+    """Assign the entries of values that name a mapped attribute; ignore the rest"""
+    for key in values.keys() & mapped_attribute_names(type(instance)):
+        setattr(instance, key, values[key])
@@ -1,8 +1,15 @@
 from app import db
+from app.models.base import set_known_attributes
+from app.models.user import User
 from datetime import datetime, timezone
-from sqlalchemy import text
+from sqlalchemy import text, event, inspect, select
+from sqlalchemy.dialects.postgresql import JSONB
+from collections import Counter
 import uuid
 
+# Partial-index predicate: the hot lookups only ever read active rows
+_ACTIVE_ROWS = {'postgresql_where': text('is_active'), 'sqlite_where': text('is_active = 1')}
+
 
 class Community(db.Model):
     """Community model for agricultural communities"""
@@ -10,7 +17,7 @@ class Community(db.Model):
     __tablename__ = 'communities'
     
     id = db.Column(db.Integer, primary_key=True)
-    community_id = db.Column(db.String(36), unique=True, nullable=False, default=lambda: str(uuid.uuid4()))
+    community_id = db.Column(db.Uuid, unique=True, nullable=False, default=uuid.uuid4)
     
     # Basic community information
     name = db.Column(db.String(100), nullable=False)
@@ -46,9 +53,7 @@ def __init__(self, name, created_by, **kwargs):
         self.name = name
         self.created_by = created_by
         
-        for key, value in kwargs.items():
-            if hasattr(self, key):
-                setattr(self, key, value)
+        set_known_attributes(self, kwargs)
     
     def get_member_count(self):
         """Get actual member count"""
@@ -59,30 +64,39 @@ def get_post_count(self):
         return CommunityPost.query.filter_by(community_id=self.id, is_active=True).count()
     
     def update_stats(self):
-        """Update community statistics"""
+        """Recount community statistics (counters are otherwise kept
+        current by the listeners at the bottom of this module); the caller
+        commits"""
         self.member_count = self.get_member_count()
         self.post_count = self.get_post_count()
-        db.session.commit()
+    
+    def _get_membership(self, user_id):
+        """Return (is_member, role) for user from a single lookup"""
+        role = db.session.query(CommunityMember.role).filter_by(
+            community_id=self.id, 
+            user_id=user_id, 
+            is_active=True
+        ).first()
+        return (True, role[0]) if role else (False, None)
     
     def is_member(self, user_id):
         """Check if user is a member"""
-        return CommunityMember.query.filter_by(
+        return db.session.query(CommunityMember.query.filter_by(
             community_id=self.id, 
             user_id=user_id, 
             is_active=True
-        ).first() is not None
+        ).exists()).scalar()
     
     def get_member_role(self, user_id):
         """Get user's role in community"""
-        member = CommunityMember.query.filter_by(
-            community_id=self.id, 
-            user_id=user_id, 
-            is_active=True
-        ).first()
-        return member.role if member else None
+        return self._get_membership(user_id)[1]
     
-    def to_dict(self, include_user_info=None):
-        """Convert to dictionary"""
+    def to_dict(self, include_user_info=None, _roles=None):
+        """Convert to dictionary
+        
+        ``_roles`` is the viewer's {community id: role} map preloaded by
+        ``to_dicts``; without it membership is looked up per community.
+        """
         data = {
             'id': self.id,
             'community_id': self.community_id,
@@ -97,16 +111,32 @@ def to_dict(self, include_user_info=None):
             'district': self.district,
             'location': self.location,
             'created_by': self.created_by,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat()
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
         }
         
         if include_user_info:
-            data['is_member'] = self.is_member(include_user_info)
-            data['user_role'] = self.get_member_role(include_user_info)
+            if _roles is None:
+                data['is_member'], data['user_role'] = self._get_membership(include_user_info)
+            else:
+                data['is_member'] = self.id in _roles
+                data['user_role'] = _roles.get(self.id)
         
         return data
     
+    @classmethod
+    def to_dicts(cls, communities, viewer_id=None):
+        """Serialize a list of communities with one membership query for the viewer"""
+        if not viewer_id or not communities:
+            return [community.to_dict(include_user_info=viewer_id) for community in communities]
+        
+        roles = dict(db.session.query(CommunityMember.community_id, CommunityMember.role).filter(
+            CommunityMember.user_id == viewer_id,
+            CommunityMember.is_active == True,
+            CommunityMember.community_id.in_([community.id for community in communities])
+        ).all())
+        return [community.to_dict(include_user_info=viewer_id, _roles=roles) for community in communities]
+    
     def __repr__(self):
         return f'<Community {self.name}>'
 
@@ -133,15 +163,55 @@ class CommunityMember(db.Model):
     user = db.relationship('User', backref='community_memberships')
     
     # Composite unique constraint
-    __table_args__ = (db.UniqueConstraint('community_id', 'user_id', name='unique_community_member'),)
+    __table_args__ = (
+        db.UniqueConstraint('community_id', 'user_id', name='unique_community_member'),
+        # "My communities" and per-viewer role lookups start from the user
+        db.Index('ix_community_members_user_active', 'user_id', 'community_id', **_ACTIVE_ROWS),
+    )
     
     def __init__(self, community_id, user_id, **kwargs):
         self.community_id = community_id
         self.user_id = user_id
         
-        for key, value in kwargs.items():
-            if hasattr(self, key):
-                setattr(self, key, value)
+        set_known_attributes(self, kwargs)
+    
+    @classmethod
+    def bulk_create(cls, rows):
+        """Insert many memberships with one batched INSERT (the caller commits)
+        
+        ``rows`` are column dicts such as ``{'community_id': 1, 'user_id': 2,
+        'role': 'member'}``. executemany binds every row against the same
+        column list, so the column defaults are filled into each row and any
+        other optional keys must appear in all rows or none. Core inserts
+        bypass the flush listeners, so member_count is advanced here with one
+        UPDATE per community.
+        """
+        if not rows:
+            return
+        now = datetime.now(timezone.utc)
+        defaults = {'role': 'member', 'is_active': True, 'is_approved': True,
+                    'joined_at': now, 'updated_at': now}
+        rows = [{**defaults, **row} for row in rows]
+        db.session.execute(cls.__table__.insert(), rows)
+        
+        communities = Community.__table__
+        added = Counter(row['community_id'] for row in rows if row['is_active'])
+        for community_id, count in added.items():
+            db.session.execute(
+                communities.update()
+                .where(communities.c.id == community_id)
+                .values(member_count=communities.c.member_count + count)
+            )
+    
+    @classmethod
+    def can_participate(cls, community_id, user_id):
+        """Check if user is an active, approved member allowed to post/comment"""
+        return db.session.query(cls.query.filter_by(
+            community_id=community_id,
+            user_id=user_id,
+            is_active=True,
+            is_approved=True
+        ).exists()).scalar()
     
     def to_dict(self):
         """Convert to dictionary"""
@@ -152,8 +222,8 @@ def to_dict(self):
             'role': self.role,
             'is_active': self.is_active,
             'is_approved': self.is_approved,
-            'joined_at': self.joined_at.isoformat(),
-            'updated_at': self.updated_at.isoformat(),
+            'joined_at': self.joined_at,
+            'updated_at': self.updated_at,
             'user': self.user.to_dict() if self.user else None
         }
     
@@ -165,9 +235,16 @@ class CommunityPost(db.Model):
     """Community post model"""
     
     __tablename__ = 'community_posts'
+    # Matches the per-community feed: filter by community, pinned first, newest first
+    __table_args__ = (
+        db.Index('ix_community_posts_feed', 'community_id', 'is_pinned', 'created_at', **_ACTIVE_ROWS),
+        # Tag containment (tags @> '["weather"]') on PostgreSQL; other backends skip it
+        db.Index('ix_community_posts_tags_gin', 'tags',
+                 postgresql_using='gin').ddl_if(dialect='postgresql'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
-    post_id = db.Column(db.String(36), unique=True, nullable=False, default=lambda: str(uuid.uuid4()))
+    post_id = db.Column(db.Uuid, unique=True, nullable=False, default=uuid.uuid4)
     
     # Post basic info
     community_id = db.Column(db.Integer, db.ForeignKey('communities.id'), nullable=False)
@@ -179,7 +256,7 @@ class CommunityPost(db.Model):
     title = db.Column(db.String(200), nullable=True)  # For alerts, market posts, events
     
     # Post metadata
-    tags = db.Column(db.JSON, nullable=True)  # Array of tags
+    tags = db.Column(db.JSON().with_variant(JSONB(), 'postgresql'), nullable=True)  # Array of tags
     location = db.Column(db.String(100), nullable=True)
     
     # Alert-specific fields
@@ -208,6 +285,11 @@ class CommunityPost(db.Model):
     comments_count = db.Column(db.Integer, default=0, nullable=False)
     shares_count = db.Column(db.Integer, default=0, nullable=False)
     
+    # Author display fields, copied from users so feeds need no join
+    author_username = db.Column(db.String(80), nullable=False)
+    author_full_name = db.Column(db.String(100), nullable=True)
+    author_profile_type = db.Column(db.String(20), nullable=True)
+    
     # Timestamps
     created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
     updated_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc), nullable=False)
@@ -218,14 +300,19 @@ class CommunityPost(db.Model):
     comments = db.relationship('PostComment', backref='post', lazy=True, cascade='all, delete-orphan')
     attachments = db.relationship('PostAttachment', backref='post', lazy=True, cascade='all, delete-orphan')
     
+    # Type-specific fields, sent in list views only for posts of that type
+    TYPE_FIELDS = {
+        'alert': ('alert_type', 'alert_severity', 'alert_expires_at'),
+        'market': ('market_price', 'market_unit', 'market_crop', 'market_location'),
+        'event': ('event_date', 'event_location', 'event_type'),
+    }
+    
     def __init__(self, community_id, user_id, content, **kwargs):
         self.community_id = community_id
         self.user_id = user_id
         self.content = content
         
-        for key, value in kwargs.items():
-            if hasattr(self, key):
-                setattr(self, key, value)
+        set_known_attributes(self, kwargs)
     
     def get_likes_count(self):
         """Get actual likes count"""
@@ -236,21 +323,30 @@ def get_comments_count(self):
         return PostComment.query.filter_by(post_id=self.id, is_active=True).count()
     
     def update_engagement_stats(self):
-        """Update engagement statistics"""
+        """Recount engagement statistics (counters are otherwise kept
+        current by the listeners at the bottom of this module); the caller
+        commits"""
         self.likes_count = self.get_likes_count()
         self.comments_count = self.get_comments_count()
-        db.session.commit()
     
     def is_liked_by(self, user_id):
         """Check if post is liked by user"""
-        return PostLike.query.filter_by(
+        return db.session.query(PostLike.query.filter_by(
             post_id=self.id, 
             user_id=user_id, 
             is_active=True
-        ).first() is not None
+        ).exists()).scalar()
     
-    def to_dict(self, include_user_info=None):
-        """Convert to dictionary"""
+    def author_summary(self):
+        """Author fields needed to render the post, without loading the user"""
+        return _author_summary(self)
+    
+    def to_dict(self, include_user_info=None, _liked_ids=None):
+        """Convert to dictionary
+        
+        ``_liked_ids`` is the set of post ids the viewer likes, preloaded by
+        ``to_dicts``; without it the like is looked up per post.
+        """
         data = {
             'id': self.id,
             'post_id': self.post_id,
@@ -263,12 +359,12 @@ def to_dict(self, include_user_info=None):
             'location': self.location,
             'alert_type': self.alert_type,
             'alert_severity': self.alert_severity,
-            'alert_expires_at': self.alert_expires_at.isoformat() if self.alert_expires_at else None,
+            'alert_expires_at': self.alert_expires_at,
             'market_price': self.market_price,
             'market_unit': self.market_unit,
             'market_crop': self.market_crop,
             'market_location': self.market_location,
-            'event_date': self.event_date.isoformat() if self.event_date else None,
+            'event_date': self.event_date,
             'event_location': self.event_location,
             'event_type': self.event_type,
             'is_active': self.is_active,
@@ -277,18 +373,63 @@ def to_dict(self, include_user_info=None):
             'likes_count': self.likes_count,
             'comments_count': self.comments_count,
             'shares_count': self.shares_count,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat(),
-            'author': self.author.to_dict() if self.author else None
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
+            'author': self.author_summary()
         }
+        self._add_viewer_fields(data, include_user_info, _liked_ids)
+        return data
+    
+    def to_list_dict(self, include_user_info=None, _liked_ids=None):
+        """Compact dictionary for feed listings
         
+        Carries what a post card renders; the alert/market/event fields are
+        included only for posts of that type.
+        """
+        data = {
+            'id': self.id,
+            'community_id': self.community_id,
+            'post_type': self.post_type,
+            'title': self.title,
+            'content': self.content,
+            'location': self.location,
+            'is_pinned': self.is_pinned,
+            'likes_count': self.likes_count,
+            'comments_count': self.comments_count,
+            'created_at': self.created_at,
+            'author': self.author_summary()
+        }
+        for field in self.TYPE_FIELDS.get(self.post_type, ()):
+            data[field] = getattr(self, field)
+        self._add_viewer_fields(data, include_user_info, _liked_ids)
+        return data
+    
+    def _add_viewer_fields(self, data, include_user_info, _liked_ids):
         if include_user_info:
-            data['is_liked'] = self.is_liked_by(include_user_info)
+            if _liked_ids is None:
+                data['is_liked'] = self.is_liked_by(include_user_info)
+            else:
+                data['is_liked'] = self.id in _liked_ids
+    
+    @classmethod
+    def to_dicts(cls, posts, viewer_id=None, list_view=False):
+        """Serialize a list of posts with one like query for the viewer
         
-        return data
+        ``list_view`` selects the compact ``to_list_dict`` shape.
+        """
+        serialize = cls.to_list_dict if list_view else cls.to_dict
+        if not viewer_id or not posts:
+            return [serialize(post, include_user_info=viewer_id) for post in posts]
+        
+        liked_ids = {post_id for post_id, in db.session.query(PostLike.post_id).filter(
+            PostLike.user_id == viewer_id,
+            PostLike.is_active == True,
+            PostLike.post_id.in_([post.id for post in posts])
+        )}
+        return [serialize(post, include_user_info=viewer_id, _liked_ids=liked_ids) for post in posts]
     
     def __repr__(self):
-        return f'<CommunityPost {self.post_id[:8]}...>'
+        return f'<CommunityPost {self.post_id.hex[:8]}...>'
 
 
 class PostLike(db.Model):
@@ -307,7 +448,11 @@ class PostLike(db.Model):
     user = db.relationship('User', backref='post_likes')
     
     # Composite unique constraint
-    __table_args__ = (db.UniqueConstraint('post_id', 'user_id', name='unique_post_like'),)
+    __table_args__ = (
+        db.UniqueConstraint('post_id', 'user_id', name='unique_post_like'),
+        # Liked-by-viewer checks filter on user_id and a page of post ids
+        db.Index('ix_post_likes_user_active', 'user_id', 'post_id', **_ACTIVE_ROWS),
+    )
     
     def __init__(self, post_id, user_id):
         self.post_id = post_id
@@ -323,7 +468,7 @@ class PostComment(db.Model):
     __tablename__ = 'post_comments'
     
     id = db.Column(db.Integer, primary_key=True)
-    comment_id = db.Column(db.String(36), unique=True, nullable=False, default=lambda: str(uuid.uuid4()))
+    comment_id = db.Column(db.Uuid, unique=True, nullable=False, default=uuid.uuid4)
     
     post_id = db.Column(db.Integer, db.ForeignKey('community_posts.id'), nullable=False)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
@@ -332,6 +477,14 @@ class PostComment(db.Model):
     content = db.Column(db.Text, nullable=False)
     is_active = db.Column(db.Boolean, default=True, nullable=False)
     
+    # Active direct replies, kept current by a flush-time listener
+    replies_count = db.Column(db.Integer, default=0, nullable=False)
+    
+    # Author display fields, copied from users so threads need no join
+    author_username = db.Column(db.String(80), nullable=False)
+    author_full_name = db.Column(db.String(100), nullable=True)
+    author_profile_type = db.Column(db.String(20), nullable=True)
+    
     created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
     updated_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc), nullable=False)
     
@@ -344,9 +497,11 @@ def __init__(self, post_id, user_id, content, **kwargs):
         self.user_id = user_id
         self.content = content
         
-        for key, value in kwargs.items():
-            if hasattr(self, key):
-                setattr(self, key, value)
+        set_known_attributes(self, kwargs)
+    
+    def author_summary(self):
+        """Author fields needed to render the comment, without loading the user"""
+        return _author_summary(self)
     
     def to_dict(self):
         """Convert to dictionary"""
@@ -358,14 +513,14 @@ def to_dict(self):
             'parent_id': self.parent_id,
             'content': self.content,
             'is_active': self.is_active,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat(),
-            'author': self.author.to_dict() if self.author else None,
-            'replies_count': len(self.replies) if self.replies else 0
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
+            'author': self.author_summary(),
+            'replies_count': self.replies_count
         }
     
     def __repr__(self):
-        return f'<PostComment {self.comment_id[:8]}...>'
+        return f'<PostComment {self.comment_id.hex[:8]}...>'
 
 
 class PostAttachment(db.Model):
@@ -374,7 +529,7 @@ class PostAttachment(db.Model):
     __tablename__ = 'post_attachments'
     
     id = db.Column(db.Integer, primary_key=True)
-    attachment_id = db.Column(db.String(36), unique=True, nullable=False, default=lambda: str(uuid.uuid4()))
+    attachment_id = db.Column(db.Uuid, unique=True, nullable=False, default=uuid.uuid4)
     
     post_id = db.Column(db.Integer, db.ForeignKey('community_posts.id'), nullable=False)
     
@@ -398,9 +553,7 @@ def __init__(self, post_id, filename, file_path, file_type, **kwargs):
         self.file_path = file_path
         self.file_type = file_type
         
-        for key, value in kwargs.items():
-            if hasattr(self, key):
-                setattr(self, key, value)
+        set_known_attributes(self, kwargs)
     
     def to_dict(self):
         """Convert to dictionary"""
@@ -416,8 +569,101 @@ def to_dict(self):
             'width': self.width,
             'height': self.height,
             'is_active': self.is_active,
-            'created_at': self.created_at.isoformat()
+            'created_at': self.created_at
         }
     
     def __repr__(self):
-        return f'<PostAttachment {self.filename}>'
\ No newline at end of file
+        return f'<PostAttachment {self.filename}>'
+
+
+_AUTHOR_FIELDS = ('username', 'full_name', 'profile_type')
+
+
+def _author_summary(row):
+    return {
+        'id': row.user_id,
+        'username': row.author_username,
+        'full_name': row.author_full_name,
+        'profile_type': row.author_profile_type,
+    }
+
+
+def _copy_author_fields(child):
+    """Fill child.author_* from the users row when a post/comment is inserted.
+
+    The values are refreshed for existing rows by ``_propagate_author_fields``
+    whenever one of the source columns changes on ``User``.
+    """
+    users = User.__table__
+    
+    @event.listens_for(child, 'before_insert')
+    def on_insert(mapper, connection, target):
+        if target.author_username is not None:
+            return
+        author = target.__dict__.get('author')
+        if author is None:
+            author = connection.execute(
+                select(*(users.c[field] for field in _AUTHOR_FIELDS))
+                .where(users.c.id == target.user_id)
+            ).first()
+        if author is not None:
+            for field in _AUTHOR_FIELDS:
+                setattr(target, f'author_{field}', getattr(author, field))
+
+
+@event.listens_for(User, 'after_update')
+def _propagate_author_fields(mapper, connection, target):
+    """Push username/full_name/profile_type changes to denormalized copies"""
+    state = inspect(target)
+    if not any(state.attrs[field].history.has_changes() for field in _AUTHOR_FIELDS):
+        return
+    values = {f'author_{field}': getattr(target, field) for field in _AUTHOR_FIELDS}
+    for model in (CommunityPost, PostComment):
+        table = model.__table__
+        connection.execute(
+            table.update().where(table.c.user_id == target.id).values(values)
+        )
+
+
+def _track_active_count(child, parent, foreign_key, counter):
+    """Keep parent.<counter> equal to the number of active child rows.
+    
+    Inserts, deletes and is_active toggles on the child adjust the counter
+    with a single UPDATE in the same flush instead of a COUNT(*) afterwards.
+    """
+    parent_table = parent.__table__
+    
+    def adjust(connection, parent_id, delta):
+        if parent_id is None:
+            return
+        connection.execute(
+            parent_table.update()
+            .where(parent_table.c.id == parent_id)
+            .values({counter: parent_table.c[counter] + delta})
+        )
+    
+    @event.listens_for(child, 'after_insert')
+    def on_insert(mapper, connection, target):
+        if target.is_active is not False:
+            adjust(connection, getattr(target, foreign_key), 1)
+    
+    @event.listens_for(child, 'after_delete')
+    def on_delete(mapper, connection, target):
+        if target.is_active:
+            adjust(connection, getattr(target, foreign_key), -1)
+    
+    @event.listens_for(child, 'after_update')
+    def on_update(mapper, connection, target):
+        history = inspect(target).attrs.is_active.history
+        if history.has_changes():
+            adjust(connection, getattr(target, foreign_key), 1 if target.is_active else -1)
+
+
+_track_active_count(CommunityMember, Community, 'community_id', 'member_count')
+_track_active_count(CommunityPost, Community, 'community_id', 'post_count')
+_track_active_count(PostLike, CommunityPost, 'post_id', 'likes_count')
+_track_active_count(PostComment, CommunityPost, 'post_id', 'comments_count')
+_track_active_count(PostComment, PostComment, 'parent_id', 'replies_count')
+
+_copy_author_fields(CommunityPost)
+_copy_author_fields(PostComment)
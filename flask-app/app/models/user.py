@@ -1,8 +1,15 @@
 from app import db
+from app.models.base import set_known_attributes
 from datetime import datetime, timezone
+from sqlalchemy import event, text
 from werkzeug.security import generate_password_hash, check_password_hash
 import uuid
 
+# Pinned scrypt cost (N=2**15, r=8, p=1) so each login spends a bounded,
+# predictable amount of CPU regardless of the werkzeug default in use.
+# Only login verifies passwords; session auth looks up UserSession.session_id.
+PASSWORD_HASH_METHOD = 'scrypt:32768:8:1'
+
 
 class User(db.Model):
     """User model for authentication and profile management"""
@@ -10,7 +17,7 @@ class User(db.Model):
     __tablename__ = 'users'
     
     id = db.Column(db.Integer, primary_key=True)
-    user_id = db.Column(db.String(36), unique=True, nullable=False, default=lambda: str(uuid.uuid4()))
+    user_id = db.Column(db.Uuid, unique=True, nullable=False, default=uuid.uuid4)
     
     # Basic user information
     email = db.Column(db.String(120), unique=True, nullable=False, index=True)
@@ -44,6 +51,9 @@ class User(db.Model):
     onboarding_completed = db.Column(db.Boolean, default=False, nullable=False)
     onboarding_step = db.Column(db.Integer, default=0, nullable=False)
     
+    # Cached get_profile_completion(), refreshed whenever the row is flushed
+    profile_completion = db.Column(db.Integer, default=0, nullable=False)
+    
     # Timestamps
     created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
     updated_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc), nullable=False)
@@ -58,28 +68,24 @@ def __init__(self, email, username, password, **kwargs):
         self.set_password(password)
         
         # Set optional fields
-        for key, value in kwargs.items():
-            if hasattr(self, key):
-                setattr(self, key, value)
+        set_known_attributes(self, kwargs)
     
     def set_password(self, password):
         """Hash and set the password"""
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = generate_password_hash(password, method=PASSWORD_HASH_METHOD)
     
     def check_password(self, password):
         """Check if provided password matches the hash"""
         return check_password_hash(self.password_hash, password)
     
     def update_last_login(self):
-        """Update the last login timestamp"""
+        """Update the last login timestamp (the caller commits)"""
         self.last_login = datetime.now(timezone.utc)
-        db.session.commit()
     
     def complete_onboarding(self):
-        """Mark onboarding as completed"""
+        """Mark onboarding as completed (the caller commits)"""
         self.onboarding_completed = True
         self.onboarding_step = 100  # Final step
-        db.session.commit()
     
     def get_profile_completion(self):
         """Calculate profile completion percentage"""
@@ -116,19 +122,32 @@ def to_dict(self):
             'is_verified': self.is_verified,
             'onboarding_completed': self.onboarding_completed,
             'onboarding_step': self.onboarding_step,
-            'profile_completion': self.get_profile_completion(),
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'last_login': self.last_login.isoformat() if self.last_login else None
+            'profile_completion': self.profile_completion,
+            'created_at': self.created_at,
+            'last_login': self.last_login
         }
     
     def __repr__(self):
         return f'<User {self.username}>'
 
 
+@event.listens_for(User, 'before_insert')
+@event.listens_for(User, 'before_update')
+def _refresh_profile_completion(mapper, connection, target):
+    target.profile_completion = target.get_profile_completion()
+
+
 class UserSession(db.Model):
     """User session model for session management"""
     
     __tablename__ = 'user_sessions'
+    __table_args__ = (
+        # Logout-all and expiry cleanup only touch active sessions
+        db.Index('ix_user_sessions_user_active', 'user_id',
+                 postgresql_where=text('is_active'), sqlite_where=text('is_active = 1')),
+        db.Index('ix_user_sessions_active_expires', 'expires_at',
+                 postgresql_where=text('is_active'), sqlite_where=text('is_active = 1')),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     session_id = db.Column(db.String(255), unique=True, nullable=False, index=True)
@@ -149,9 +168,7 @@ def __init__(self, session_id, user_id, expires_at, **kwargs):
         self.user_id = user_id
         self.expires_at = expires_at
         
-        for key, value in kwargs.items():
-            if hasattr(self, key):
-                setattr(self, key, value)
+        set_known_attributes(self, kwargs)
     
     def is_expired(self):
         """Check if session is expired"""
@@ -163,16 +180,14 @@ def is_expired(self):
         return now > expires_at
     
     def extend_session(self, hours=24):
-        """Extend session expiration"""
+        """Extend session expiration (the caller commits)"""
         from datetime import timedelta
         self.expires_at = datetime.now(timezone.utc) + timedelta(hours=hours)
         self.last_activity = datetime.now(timezone.utc)
-        db.session.commit()
     
     def deactivate(self):
-        """Deactivate the session"""
+        """Deactivate the session (the caller commits)"""
         self.is_active = False
-        db.session.commit()
     
     def to_dict(self):
         """Convert session to dictionary"""
@@ -183,9 +198,9 @@ def to_dict(self):
             'ip_address': self.ip_address,
             'user_agent': self.user_agent,
             'is_active': self.is_active,
-            'created_at': self.created_at.isoformat(),
-            'expires_at': self.expires_at.isoformat(),
-            'last_activity': self.last_activity.isoformat(),
+            'created_at': self.created_at,
+            'expires_at': self.expires_at,
+            'last_activity': self.last_activity,
             'is_expired': self.is_expired()
         }
     
@@ -193,6 +208,11 @@ def __repr__(self):
         return f'<UserSession {self.session_id[:8]}...>'
 
 
+# Step names in order; the current step is the 1-based index of the first
+# incomplete one (6 once all are done)
+ONBOARDING_STEPS = ('welcome', 'profile_type', 'location', 'preferences', 'completed')
+
+
 class OnboardingProgress(db.Model):
     """Track user onboarding progress"""
     
@@ -223,27 +243,15 @@ class OnboardingProgress(db.Model):
     def __init__(self, user_id, **kwargs):
         self.user_id = user_id
         
-        for key, value in kwargs.items():
-            if hasattr(self, key):
-                setattr(self, key, value)
-    
-    def get_current_step(self):
-        """Get the current onboarding step"""
-        if not self.step_welcome:
-            return 1
-        elif not self.step_profile_type:
-            return 2
-        elif not self.step_location:
-            return 3
-        elif not self.step_preferences:
-            return 4
-        elif not self.step_completed:
-            return 5
-        else:
-            return 6  # Completed
+        set_known_attributes(self, kwargs)
+    
+    def get_current_step(self, flags=None):
+        """Get the current onboarding step (6 once every step is done)"""
+        steps = flags if flags is not None else self._step_flags()
+        return next((number for number, done in enumerate(steps, 1) if not done), len(steps) + 1)
     
     def complete_step(self, step_name):
-        """Mark a specific step as completed"""
+        """Mark a specific step as completed (the caller commits)"""
         if hasattr(self, f'step_{step_name}'):
             setattr(self, f'step_{step_name}', True)
             
@@ -254,39 +262,36 @@ def complete_step(self, step_name):
                 
                 # Update user's onboarding status
                 self.user.complete_onboarding()
-        
-        db.session.commit()
     
-    def get_progress_percentage(self):
-        """Calculate onboarding progress percentage"""
-        steps = [
+    def _step_flags(self):
+        """The five step booleans, read once, in onboarding order"""
+        return (
             self.step_welcome,
             self.step_profile_type,
             self.step_location,
             self.step_preferences,
             self.step_completed
-        ]
-        completed_steps = sum(steps)
+        )
+    
+    def get_progress_percentage(self, flags=None):
+        """Calculate onboarding progress percentage"""
+        steps = flags if flags is not None else self._step_flags()
+        completed_steps = sum(1 for done in steps if done)
         return int((completed_steps / len(steps)) * 100)
     
     def to_dict(self):
         """Convert to dictionary"""
+        flags = self._step_flags()
         return {
             'user_id': self.user_id,
-            'current_step': self.get_current_step(),
-            'progress_percentage': self.get_progress_percentage(),
-            'steps': {
-                'welcome': self.step_welcome,
-                'profile_type': self.step_profile_type,
-                'location': self.step_location,
-                'preferences': self.step_preferences,
-                'completed': self.step_completed
-            },
+            'current_step': self.get_current_step(flags),
+            'progress_percentage': self.get_progress_percentage(flags),
+            'steps': dict(zip(ONBOARDING_STEPS, flags)),
             'selected_features': self.selected_features,
             'notification_preferences': self.notification_preferences,
-            'started_at': self.started_at.isoformat(),
-            'completed_at': self.completed_at.isoformat() if self.completed_at else None,
-            'updated_at': self.updated_at.isoformat()
+            'started_at': self.started_at,
+            'completed_at': self.completed_at,
+            'updated_at': self.updated_at
         }
     
     def __repr__(self):
@@ -1,369 +1,600 @@
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, jsonify, request, Response
+from app.utils.helpers import cached_response, coalesce_calls, iso_now, stream_json
+from app.services.http_client import pooled_session
 from app.services.data_service import DataService
 from app.services.power_api import PowerAPIService
 from app.services.gpm_api import get_gpm_data
 from app.services.modis_api import get_modis_air_quality
 from app.services.worldview_api import get_worldview_image, get_available_layers
+import csv
+import hashlib
+import io
 import logging
+import math
+import orjson
+import os
 import random
+import re
+import struct
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from typing import NamedTuple
 
 logger = logging.getLogger(__name__)
 
 api_bp = Blueprint('api', __name__)
 
-@api_bp.route('/data')
+# The Worldview layer catalogue is static, so build it and its response once
+AVAILABLE_LAYERS = get_available_layers()
+_LAYERS_BODY = orjson.dumps({
+    'success': True,
+    'layers': AVAILABLE_LAYERS,
+    'layer_count': len(AVAILABLE_LAYERS)
+}) + b'\n'
+_LAYERS_ETAG = hashlib.blake2b(_LAYERS_BODY, digest_size=16).hexdigest()
+
+# Parameter help returned with every 400 for a missing argument; built once
+DATE_RANGE_REQUIRED_PARAMS = {
+    'lat': 'Latitude (-90 to 90)',
+    'lon': 'Longitude (-180 to 180)',
+    'start': 'Start date (YYYYMMDD)',
+    'end': 'End date (YYYYMMDD)'
+}
+POWER_REQUIRED_PARAMS = {
+    **DATE_RANGE_REQUIRED_PARAMS,
+    'parameters': 'Comma-separated parameters (optional)'
+}
+WORLDVIEW_REQUIRED_PARAMS = {
+    'lat': 'Latitude (-90 to 90)',
+    'lon': 'Longitude (-180 to 180)',
+    'date': 'Date (YYYY-MM-DD)',
+    'layers': 'Comma-separated layer names',
+    'bbox_size': 'Bounding box size in degrees (optional, default: 0.5)'
+}
+
+INVALID_COORDINATES = 'Invalid coordinate values. Latitude and longitude must be numeric.'
+
+# Longer strings are never legitimate numbers here; refuse them before float()
+MAX_NUMBER_LENGTH = 24
+COORDINATE_BOUNDS = {
+    'lat': (-90.0, 90.0, 'Latitude must be between -90 and 90'),
+    'lon': (-180.0, 180.0, 'Longitude must be between -180 and 180')
+}
+
+def _parse_number(value):
+    """Return value as a finite float, or None if it is not one"""
+    if isinstance(value, str) and len(value) > MAX_NUMBER_LENGTH:
+        return None
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if math.isfinite(number) else None
+
+def _coerce_numbers(args, floats, invalid_message=INVALID_COORDINATES):
+    """Convert args[name] to float in place for each name in floats
+
+    Returns an error message for the first bad or out-of-range value, or None.
+    """
+    for name in floats:
+        number = _parse_number(args[name])
+        if number is None:
+            return invalid_message
+        bounds = COORDINATE_BOUNDS.get(name)
+        if bounds and not bounds[0] <= number <= bounds[1]:
+            return bounds[2]
+        args[name] = number
+    return None
+
+# Compiled once; text arguments must fully match before any service sees them
+ARG_FORMATS = {
+    'start': (re.compile(r'\d{8}'), 'Start date must be in YYYYMMDD format'),
+    'end': (re.compile(r'\d{8}'), 'End date must be in YYYYMMDD format'),
+    'date': (re.compile(r'\d{4}-\d{2}-\d{2}'), 'Date must be in YYYY-MM-DD format'),
+    'layers': (re.compile(r'[A-Za-z0-9_.,-]{1,256}'), 'Layers must be a comma-separated list of layer names'),
+    'parameters': (re.compile(r'[A-Za-z0-9_,]{1,256}'), 'Parameters must be a comma-separated list of parameter names')
+}
+
+def _check_formats(args, names):
+    """Return an error message for the first malformed text argument, or None"""
+    for name in names:
+        check = ARG_FORMATS.get(name)
+        if check and not check[0].fullmatch(args[name]):
+            return check[1]
+    return None
+
+MAX_DATE_RANGE = timedelta(days=365 * 5)
+
+def _check_date_range(args, names):
+    """Return an error for a start/end pair no upstream could answer, or None"""
+    if 'start' not in names or 'end' not in names:
+        return None
+    try:
+        start = datetime.strptime(args['start'], '%Y%m%d')
+        end = datetime.strptime(args['end'], '%Y%m%d')
+    except ValueError:
+        return 'Invalid date format. Use YYYYMMDD format'
+    if start > end:
+        return 'Start date must be before or equal to end date'
+    if end > datetime.now() + timedelta(days=1):
+        return 'End date cannot be in the future'
+    if end - start > MAX_DATE_RANGE:
+        return 'Date range cannot exceed 5 years'
+    return None
+
+# (endpoint, missing names) -> serialized 400 body; at most 2**len(required)
+# entries per endpoint, so it is filled on demand and never evicted
+_missing_param_bodies = {}
+
+def _missing_params_response(args, required, required_params, empty, missing_extra=None):
+    """Return the cached 400 response if any required argument is blank, else None"""
+    missing = tuple(name for name in required if not args.get(name))
+    if not missing:
+        return None
+    key = (request.endpoint, missing)
+    body = _missing_param_bodies.get(key)
+    if body is None:
+        body = _missing_param_bodies[key] = orjson.dumps({
+            'success': False,
+            'error': f"Missing required parameters: {', '.join(missing)}",
+            **empty,
+            'required_params': required_params,
+            **(missing_extra or {})
+        }) + b'\n'
+    return Response(body, status=400, mimetype='application/json')
+
+def _parse_geo_args(required, required_params, empty, defaults=None, floats=('lat', 'lon'),
+                    invalid_message=INVALID_COORDINATES, missing_extra=None, check_missing=True):
+    """Read and validate a NASA proxy endpoint's query string in one pass
+
+    Returns (args, None) with text formats checked, the float fields
+    converted and lat/lon range checked, or (None, response) with the 400
+    response to send back. ``empty`` holds the placeholder result fields
+    each endpoint includes in its error bodies, and ``missing_extra`` any
+    extra fields for the missing-argument case. Pass ``check_missing=False``
+    when reject_missing_params() has already vetted the request.
+    """
+    args = dict(defaults) if defaults else {}
+    args.update(request.args.items())
+
+    if check_missing:
+        error = _missing_params_response(args, required, required_params, empty, missing_extra)
+        if error:
+            return None, error
+
+    names = (*required, *(defaults or ()))
+    error = (_check_formats(args, names)
+             or _check_date_range(args, names)
+             or _coerce_numbers(args, floats, invalid_message))
+    if error:
+        return None, (jsonify({'success': False, 'error': error, **empty}), 400)
+
+    return args, None
+
+@api_bp.route('/data', methods=['GET'], strict_slashes=False)
 def get_data():
-    """Get general data endpoint"""
+    """Get paginated data records (query: page, per_page up to 100)"""
     try:
-        data_service = DataService()
-        result = data_service.get_sample_data()
+        page = request.args.get('page', 1, type=int)
+        per_page = min(request.args.get('per_page', 50, type=int), 100)
+        result, error = DataService.get_all_data_records(page=page, per_page=per_page)
+        if error:
+            logger.error(f"Error in data endpoint: {error}")
+            return jsonify({'error': 'Internal server error'}), 500
         return jsonify(result)
     except Exception as e:
         logger.error(f"Error in data endpoint: {str(e)}")
         return jsonify({'error': 'Internal server error'}), 500
 
-@api_bp.route('/power-data')
-def get_power_data():
-    """
-    Get NASA POWER satellite weather data for specified location and date range.
-    
-    Query Parameters:
-    - lat (float): Latitude (-90 to 90)
-    - lon (float): Longitude (-180 to 180)
-    - start (string): Start date in YYYYMMDD format
-    - end (string): End date in YYYYMMDD format
-    - parameters (string, optional): Comma-separated list of parameters (default: T2M,PRECTOTCORR)
-    
-    Returns:
-    - JSON with weather data including temperature, precipitation, and metadata
-    """
+def _present_worldview(result):
+    """Trim a Worldview service result down to the public response fields"""
+    if result['success']:
+        return {
+            'success': True,
+            'date': result['date'],
+            'layers': result['layers'],
+            'image_url': result['image_url'],
+            'location': result['location'],
+            'bbox': result['bbox'],
+            'metadata': result['metadata']
+        }, 200
+    return {'success': False, 'error': result['error'], 'image_url': None}, 400
+
+def _present_result(result):
+    return result, 200 if result['success'] else 400
+
+# Server-side cache lifetimes; recent days may still be backfilled upstream
+PROXY_CACHE_SETTLED = 86400
+PROXY_CACHE_RECENT = 300
+# Data ending at least this many days ago is treated as final
+ARCHIVE_SETTLED_DAYS = 7
+
+def _days_since_end():
+    """Days between today and the query's end (or Worldview) date, or None"""
+    end = request.args.get('end')
+    if end:
+        fmt = '%Y%m%d'
+    else:
+        end = request.args.get('date')
+        fmt = '%Y-%m-%d'
+    if not end:
+        return None
     try:
-        # Get required parameters
-        lat = request.args.get('lat')
-        lon = request.args.get('lon')
-        start = request.args.get('start')
-        end = request.args.get('end')
-        parameters = request.args.get('parameters', 'T2M,PRECTOTCORR')
-        
-        # Validate required parameters
-        missing_params = []
-        if not lat:
-            missing_params.append('lat')
-        if not lon:
-            missing_params.append('lon')
-        if not start:
-            missing_params.append('start')
-        if not end:
-            missing_params.append('end')
-        
-        if missing_params:
-            return jsonify({
-                'success': False,
-                'error': f"Missing required parameters: {', '.join(missing_params)}",
-                'data': [],
-                'required_params': {
-                    'lat': 'Latitude (-90 to 90)',
-                    'lon': 'Longitude (-180 to 180)',
-                    'start': 'Start date (YYYYMMDD)',
-                    'end': 'End date (YYYYMMDD)',
-                    'parameters': 'Comma-separated parameters (optional)'
-                }
-            }), 400
-        
-        # Convert coordinates to float
-        try:
-            lat = float(lat)
-            lon = float(lon)
-        except ValueError:
-            return jsonify({
-                'success': False,
-                'error': 'Invalid coordinate values. Latitude and longitude must be numeric.',
-                'data': []
-            }), 400
-        
-        # Log the request
-        logger.info(f"NASA POWER API request: lat={lat}, lon={lon}, start={start}, end={end}, params={parameters}")
-        
-        # Initialize the PowerAPIService and get data
-        power_service = PowerAPIService()
-        result = power_service.get_power_data(lat, lon, start, end, parameters)
-        
-        # Return appropriate HTTP status code
-        if result['success']:
-            return jsonify(result)
-        else:
-            return jsonify(result), 400
-            
-    except Exception as e:
-        logger.error(f"Unexpected error in power-data endpoint: {str(e)}")
-        return jsonify({
-            'success': False,
-            'error': 'An unexpected error occurred while processing your request.',
-            'data': []
-        }), 500
+        return (datetime.utcnow().date() - datetime.strptime(end, fmt).date()).days
+    except ValueError:
+        return None
 
-@api_bp.route('/gpm-data')
-def get_gpm_precipitation_data():
-    """
-    Get NASA GPM IMERG precipitation data for specified location and date range.
-    
-    Query Parameters:
-    - lat (float): Latitude (-90 to 90)
-    - lon (float): Longitude (-180 to 180)
-    - start (string): Start date in YYYYMMDD format
-    - end (string): End date in YYYYMMDD format
-    
-    Returns:
-    - JSON with precipitation data and metadata
+def _archive_settled():
+    """True when the requested range ends far enough back to be final"""
+    days = _days_since_end()
+    return days is not None and days >= ARCHIVE_SETTLED_DAYS
+
+def _proxy_cache_timeout():
+    """Server-side cache lifetime: long once the archive has settled"""
+    return PROXY_CACHE_SETTLED if _archive_settled() else PROXY_CACHE_RECENT
+
+# Successful results with at least this many records are streamed rather
+# than serialized in one piece; streamed bodies skip the response cache
+STREAM_MIN_RECORDS = 1000
+
+# One entry per NASA proxy route; _make_proxy_handler turns each into a view
+NASA_PROXY_SPECS = {
+    'power-data': {
+        'endpoint': 'get_power_data',
+        'label': 'NASA POWER',
+        'required': ('lat', 'lon', 'start', 'end'),
+        'required_params': POWER_REQUIRED_PARAMS,
+        'defaults': {'parameters': 'T2M,PRECTOTCORR'},
+        'service_args': ('lat', 'lon', 'start', 'end', 'parameters'),
+        'service': PowerAPIService.get_power_data,
+        'empty': {'data': []},
+        'doc': """
+        Get NASA POWER satellite weather data for specified location and date range.
+
+        Query Parameters:
+        - lat (float): Latitude (-90 to 90)
+        - lon (float): Longitude (-180 to 180)
+        - start (string): Start date in YYYYMMDD format
+        - end (string): End date in YYYYMMDD format
+        - parameters (string, optional): Comma-separated list of parameters (default: T2M,PRECTOTCORR)
+
+        Returns:
+        - JSON with weather data including temperature, precipitation, and metadata
+        """
+    },
+    'gpm-data': {
+        'endpoint': 'get_gpm_precipitation_data',
+        'label': 'NASA GPM',
+        'required': ('lat', 'lon', 'start', 'end'),
+        'required_params': DATE_RANGE_REQUIRED_PARAMS,
+        'service_args': ('lat', 'lon', 'start', 'end'),
+        'service': get_gpm_data,
+        'empty': {'data': []},
+        'doc': """
+        Get NASA GPM IMERG precipitation data for specified location and date range.
+
+        Query Parameters:
+        - lat (float): Latitude (-90 to 90)
+        - lon (float): Longitude (-180 to 180)
+        - start (string): Start date in YYYYMMDD format
+        - end (string): End date in YYYYMMDD format
+
+        Returns:
+        - JSON with precipitation data and metadata
+        """
+    },
+    'modis-air': {
+        'endpoint': 'get_modis_air_quality_data',
+        'label': 'NASA MODIS Air Quality',
+        'required': ('lat', 'lon', 'start', 'end'),
+        'required_params': DATE_RANGE_REQUIRED_PARAMS,
+        'service_args': ('lat', 'lon', 'start', 'end'),
+        'service': get_modis_air_quality,
+        'empty': {'data': []},
+        'doc': """
+        Get NASA MODIS Aerosol Optical Depth (AOD) air quality data for specified location and date range.
+
+        Query Parameters:
+        - lat (float): Latitude (-90 to 90)
+        - lon (float): Longitude (-180 to 180) 
+        - start (string): Start date in YYYYMMDD format
+        - end (string): End date in YYYYMMDD format
+
+        Returns:
+        - JSON with air quality data, aerosol index, health advisories, and metadata
+
+        Air Quality Levels:
+        - Good (AOD 0.0-0.1): Safe for all outdoor activities
+        - Moderate (AOD 0.1-0.3): Acceptable for most people
+        - Unhealthy for Sensitive (AOD 0.3-0.6): Sensitive groups should limit exposure
+        - Unhealthy (AOD 0.6-1.0): Everyone should limit outdoor activities
+        - Very Unhealthy (AOD 1.0-1.5): Health warnings for all
+        - Hazardous (AOD >1.5): Emergency conditions
+        """
+    },
+    'worldview-image': {
+        'endpoint': 'get_worldview_image_data',
+        'label': 'NASA Worldview',
+        'required': ('lat', 'lon', 'date', 'layers'),
+        'required_params': WORLDVIEW_REQUIRED_PARAMS,
+        'defaults': {'bbox_size': 0.5},
+        'floats': ('lat', 'lon', 'bbox_size'),
+        'invalid_message': 'Invalid numeric values. Latitude, longitude, and bbox_size must be numeric.',
+        'missing_extra': {'available_layers': AVAILABLE_LAYERS},
+        'service_args': ('lat', 'lon', 'date', 'layers', 'bbox_size'),
+        'service': get_worldview_image,
+        'present': _present_worldview,
+        'empty': {'image_url': None},
+        'doc': """
+        Get NASA Worldview satellite imagery for specified location and date.
+
+        Query Parameters:
+        - lat (float): Latitude (-90 to 90)
+        - lon (float): Longitude (-180 to 180)
+        - date (string): Date in YYYY-MM-DD format
+        - layers (string): Comma-separated layer names (e.g., MODIS_Terra_CorrectedReflectance_TrueColor)
+        - bbox_size (float, optional): Size of bounding box in degrees (default: 0.5)
+
+        Returns:
+        - JSON with image URL and metadata
+
+        Common Layers:
+        - MODIS_Terra_CorrectedReflectance_TrueColor: True color satellite imagery
+        - MODIS_Aqua_CorrectedReflectance_TrueColor: Aqua satellite true color
+        - MODIS_Terra_CorrectedReflectance_Bands721: False color (vegetation analysis)
+        - VIIRS_SNPP_CorrectedReflectance_TrueColor: VIIRS true color imagery
+        - MODIS_Terra_Aerosol: Aerosol optical depth visualization
+        """
+    }
+}
+
+def _internal_error_body(**fields):
+    """Serialize a 500 body once so an upstream outage does not re-encode it
+
+    Callers wrap the bytes in a fresh Response each time, since after_request
+    hooks may still add headers to it.
     """
-    try:
-        # Get required parameters
-        lat = request.args.get('lat')
-        lon = request.args.get('lon')
-        start = request.args.get('start')
-        end = request.args.get('end')
-        
-        # Validate required parameters
-        missing_params = []
-        if not lat:
-            missing_params.append('lat')
-        if not lon:
-            missing_params.append('lon')
-        if not start:
-            missing_params.append('start')
-        if not end:
-            missing_params.append('end')
-        
-        if missing_params:
-            return jsonify({
-                'success': False,
-                'error': f"Missing required parameters: {', '.join(missing_params)}",
-                'data': [],
-                'required_params': {
-                    'lat': 'Latitude (-90 to 90)',
-                    'lon': 'Longitude (-180 to 180)',
-                    'start': 'Start date (YYYYMMDD)',
-                    'end': 'End date (YYYYMMDD)'
-                }
-            }), 400
-        
-        # Convert coordinates to float
+    return orjson.dumps({
+        'success': False,
+        'error': 'An unexpected error occurred while processing your request.',
+        **fields
+    }) + b'\n'
+
+def _make_proxy_handler(name, spec):
+    """Build the view for one NASA proxy route from its NASA_PROXY_SPECS entry"""
+    required = spec['required']
+    required_params = spec['required_params']
+    empty = spec['empty']
+    defaults = spec.get('defaults')
+    floats = spec.get('floats', ('lat', 'lon'))
+    invalid_message = spec.get('invalid_message', INVALID_COORDINATES)
+    service_args = spec['service_args']
+    service = spec['service']
+    present = spec.get('present', _present_result)
+    # Formatted lazily by logging, only when INFO is enabled
+    log_format = f"{spec['label']} API request: " + ", ".join(f"{key}=%s" for key in service_args)
+    error_body = _internal_error_body(**empty)
+
+    def handler():
         try:
-            lat = float(lat)
-            lon = float(lon)
-        except ValueError:
-            return jsonify({
-                'success': False,
-                'error': 'Invalid coordinate values. Latitude and longitude must be numeric.',
-                'data': []
-            }), 400
-        
-        # Log the request
-        logger.info(f"NASA GPM API request: lat={lat}, lon={lon}, start={start}, end={end}")
-        
-        # Call the GPM precipitation service
-        result = get_gpm_data(lat, lon, start, end)
-        
-        # Return appropriate HTTP status code
-        if result['success']:
-            return jsonify(result)
-        else:
-            return jsonify(result), 400
-            
-    except Exception as e:
-        logger.error(f"Unexpected error in gpm-data endpoint: {str(e)}")
-        return jsonify({
-            'success': False,
-            'error': 'An unexpected error occurred while processing your request.',
-            'data': []
-        }), 500
+            args, error = _parse_geo_args(
+                required, required_params, empty, defaults=defaults, floats=floats,
+                invalid_message=invalid_message, check_missing=False
+            )
+            if error:
+                return error
+            values = tuple(args[key] for key in service_args)
+
+            logger.info(log_format, *values)
+
+            result = coalesce_calls((name, *values), service, *values)
+            body, status = present(result)
+            if status == 200 and len(body.get('data') or ()) >= STREAM_MIN_RECORDS:
+                return Response(stream_json(body), mimetype='application/json')
+            return jsonify(body), status
+
+        except Exception as e:
+            logger.error(f"Unexpected error in {name} endpoint: {str(e)}")
+            return Response(error_body, status=500, mimetype='application/json')
+
+    handler.__name__ = spec['endpoint']
+    handler.__doc__ = spec['doc']
+    return handler
 
-@api_bp.route('/modis-air')
-def get_modis_air_quality_data():
+for _name, _spec in NASA_PROXY_SPECS.items():
+    api_bp.add_url_rule(
+        f'/{_name}', methods=['GET'], strict_slashes=False,
+        view_func=cached_response(timeout=_proxy_cache_timeout)(_make_proxy_handler(_name, _spec))
+    )
+
+# Proxy specs by endpoint name for the missing-parameter fast path. No
+# required argument has a default, so request.args alone decides it.
+_PROXY_SPECS_BY_ENDPOINT = {f"{api_bp.name}.{spec['endpoint']}": spec for spec in NASA_PROXY_SPECS.values()}
+
+@api_bp.before_request
+def reject_missing_params():
+    """Answer proxy requests missing a required argument before the response
+    cache and the view run"""
+    spec = _PROXY_SPECS_BY_ENDPOINT.get(request.endpoint)
+    if spec is None:
+        return None
+    return _missing_params_response(
+        request.args, spec['required'], spec['required_params'], spec['empty'], spec.get('missing_extra')
+    )
+
+MAX_BATCH_POINTS = 50
+_BATCH_ERROR_BODY = _internal_error_body(results=[])
+# Shared by the batch, bundle and imagery endpoints to run upstream calls side by side
+_fanout_pool = ThreadPoolExecutor(max_workers=16, thread_name_prefix='nasa-fanout')
+
+@api_bp.route('/power-data/batch', methods=['POST'], strict_slashes=False)
+def get_power_data_batch():
     """
-    Get NASA MODIS Aerosol Optical Depth (AOD) air quality data for specified location and date range.
+    Get NASA POWER data for several locations and date ranges in one request.
     
-    Query Parameters:
+    Request Body (JSON array, up to 50 items):
     - lat (float): Latitude (-90 to 90)
-    - lon (float): Longitude (-180 to 180) 
+    - lon (float): Longitude (-180 to 180)
     - start (string): Start date in YYYYMMDD format
     - end (string): End date in YYYYMMDD format
+    - parameters (string, optional): Comma-separated list of parameters (default: T2M,PRECTOTCORR)
     
     Returns:
-    - JSON with air quality data, aerosol index, health advisories, and metadata
-    
-    Air Quality Levels:
-    - Good (AOD 0.0-0.1): Safe for all outdoor activities
-    - Moderate (AOD 0.1-0.3): Acceptable for most people
-    - Unhealthy for Sensitive (AOD 0.3-0.6): Sensitive groups should limit exposure
-    - Unhealthy (AOD 0.6-1.0): Everyone should limit outdoor activities
-    - Very Unhealthy (AOD 1.0-1.5): Health warnings for all
-    - Hazardous (AOD >1.5): Emergency conditions
+    - JSON with one /power-data result per item, in request order
     """
     try:
-        # Get required parameters
-        lat = request.args.get('lat')
-        lon = request.args.get('lon')
-        start = request.args.get('start')
-        end = request.args.get('end')
-        
-        # Validate required parameters
-        missing_params = []
-        if not lat:
-            missing_params.append('lat')
-        if not lon:
-            missing_params.append('lon')
-        if not start:
-            missing_params.append('start')
-        if not end:
-            missing_params.append('end')
-        
-        if missing_params:
+        items = request.get_json(silent=True)
+        if not isinstance(items, list) or not items:
             return jsonify({
                 'success': False,
-                'error': f"Missing required parameters: {', '.join(missing_params)}",
-                'data': [],
-                'required_params': {
-                    'lat': 'Latitude (-90 to 90)',
-                    'lon': 'Longitude (-180 to 180)',
-                    'start': 'Start date (YYYYMMDD)',
-                    'end': 'End date (YYYYMMDD)'
-                }
+                'error': 'Request body must be a non-empty JSON array of {lat, lon, start, end} objects',
+                'results': [],
+                'required_params': POWER_REQUIRED_PARAMS
             }), 400
-        
-        # Convert coordinates to float
-        try:
-            lat = float(lat)
-            lon = float(lon)
-        except ValueError:
+        if len(items) > MAX_BATCH_POINTS:
             return jsonify({
                 'success': False,
-                'error': 'Invalid coordinate values. Latitude and longitude must be numeric.',
-                'data': []
+                'error': f"A batch may contain at most {MAX_BATCH_POINTS} items",
+                'results': []
             }), 400
         
-        # Log the request
-        logger.info(f"NASA MODIS Air Quality API request: lat={lat}, lon={lon}, start={start}, end={end}")
+        spec = NASA_PROXY_SPECS['power-data']
+        calls = []
+        for index, item in enumerate(items):
+            if not isinstance(item, dict):
+                return jsonify({'success': False, 'error': f"Item {index} must be an object", 'results': []}), 400
+            args = {**spec['defaults'], **item}
+            missing = [name for name in spec['required'] if args.get(name) in (None, '')]
+            if not missing:
+                for name in ('start', 'end', 'parameters'):
+                    args[name] = str(args[name])
+            error = (f"Missing required parameters: {', '.join(missing)}" if missing
+                     else _check_formats(args, spec['service_args'])
+                     or _check_date_range(args, spec['service_args'])
+                     or _coerce_numbers(args, ('lat', 'lon')))
+            if error:
+                return jsonify({'success': False, 'error': f"Item {index}: {error}", 'results': []}), 400
+            calls.append(tuple(args[name] for name in spec['service_args']))
+        
+        logger.info("NASA POWER API batch request: %d items", len(calls))
+        
+        # Repeated points in one batch share a single upstream call
+        futures = {
+            call: _fanout_pool.submit(
+                coalesce_calls, ('power-data', *call), PowerAPIService.get_power_data, *call
+            )
+            for call in dict.fromkeys(calls)
+        }
+        results = [futures[call].result() for call in calls]
         
-        # Call the MODIS air quality service
-        result = get_modis_air_quality(lat, lon, start, end)
+        return jsonify({
+            'success': True,
+            'count': len(results),
+            'results': results
+        })
         
-        # Return appropriate HTTP status code
-        if result['success']:
-            return jsonify(result)
-        else:
-            return jsonify(result), 400
-            
     except Exception as e:
-        logger.error(f"Unexpected error in modis-air endpoint: {str(e)}")
-        return jsonify({
-            'success': False,
-            'error': 'An unexpected error occurred while processing your request.',
-            'data': []
-        }), 500
+        logger.error(f"Unexpected error in power-data batch endpoint: {str(e)}")
+        return Response(_BATCH_ERROR_BODY, status=500, mimetype='application/json')
 
-@api_bp.route('/worldview-image')
-def get_worldview_image_data():
+BUNDLE_DEFAULT_LAYERS = 'MODIS_Terra_CorrectedReflectance_TrueColor'
+_BUNDLE_ERROR_BODY = _internal_error_body(data={})
+
+@api_bp.route('/nasa-bundle', methods=['GET'], strict_slashes=False)
+def get_nasa_bundle():
     """
-    Get NASA Worldview satellite imagery for specified location and date.
+    Get POWER, GPM, MODIS and Worldview data for one location in one request.
     
     Query Parameters:
     - lat (float): Latitude (-90 to 90)
     - lon (float): Longitude (-180 to 180)
-    - date (string): Date in YYYY-MM-DD format
-    - layers (string): Comma-separated layer names (e.g., MODIS_Terra_CorrectedReflectance_TrueColor)
-    - bbox_size (float, optional): Size of bounding box in degrees (default: 0.5)
+    - start (string): Start date in YYYYMMDD format
+    - end (string): End date in YYYYMMDD format; also the Worldview image date
+    - parameters (string, optional): POWER parameters (default: T2M,PRECTOTCORR)
+    - layers (string, optional): Worldview layers (default: MODIS Terra true color)
     
     Returns:
-    - JSON with image URL and metadata
-    
-    Common Layers:
-    - MODIS_Terra_CorrectedReflectance_TrueColor: True color satellite imagery
-    - MODIS_Aqua_CorrectedReflectance_TrueColor: Aqua satellite true color
-    - MODIS_Terra_CorrectedReflectance_Bands721: False color (vegetation analysis)
-    - VIIRS_SNPP_CorrectedReflectance_TrueColor: VIIRS true color imagery
-    - MODIS_Terra_Aerosol: Aerosol optical depth visualization
+    - JSON with power, gpm, modis and worldview sections, each carrying its own
+      success flag so one failing source does not hide the others
     """
     try:
-        # Get required parameters
-        lat = request.args.get('lat')
-        lon = request.args.get('lon')
-        date = request.args.get('date')
-        layers = request.args.get('layers')
-        bbox_size = request.args.get('bbox_size', 0.5)
-        
-        # Validate required parameters
-        missing_params = []
-        if not lat:
-            missing_params.append('lat')
-        if not lon:
-            missing_params.append('lon')
-        if not date:
-            missing_params.append('date')
-        if not layers:
-            missing_params.append('layers')
-        
-        if missing_params:
-            return jsonify({
-                'success': False,
-                'error': f"Missing required parameters: {', '.join(missing_params)}",
-                'image_url': None,
-                'required_params': {
-                    'lat': 'Latitude (-90 to 90)',
-                    'lon': 'Longitude (-180 to 180)',
-                    'date': 'Date (YYYY-MM-DD)',
-                    'layers': 'Comma-separated layer names',
-                    'bbox_size': 'Bounding box size in degrees (optional, default: 0.5)'
-                },
-                'available_layers': get_available_layers()
-            }), 400
-        
-        # Convert coordinates and bbox_size to float
-        try:
-            lat = float(lat)
-            lon = float(lon)
-            bbox_size = float(bbox_size)
-        except ValueError:
-            return jsonify({
-                'success': False,
-                'error': 'Invalid numeric values. Latitude, longitude, and bbox_size must be numeric.',
-                'image_url': None
-            }), 400
+        args, error = _parse_geo_args(
+            ('lat', 'lon', 'start', 'end'), POWER_REQUIRED_PARAMS, {'data': {}},
+            defaults={'parameters': 'T2M,PRECTOTCORR', 'layers': BUNDLE_DEFAULT_LAYERS}
+        )
+        if error:
+            return error
+        lat, lon, start, end = args['lat'], args['lon'], args['start'], args['end']
+        date = f"{end[:4]}-{end[4:6]}-{end[6:]}"
+        
+        logger.info("NASA bundle request: lat=%s, lon=%s, start=%s, end=%s", lat, lon, start, end)
+        
+        sections = {
+            'power': ('power-data', (lat, lon, start, end, args['parameters'])),
+            'gpm': ('gpm-data', (lat, lon, start, end)),
+            'modis': ('modis-air', (lat, lon, start, end)),
+            'worldview': ('worldview-image', (lat, lon, date, args['layers'], 0.5))
+        }
+        futures = {
+            section: _fanout_pool.submit(
+                coalesce_calls, (name, *values), NASA_PROXY_SPECS[name]['service'], *values
+            )
+            for section, (name, values) in sections.items()
+        }
         
-        # Log the request
-        logger.info(f"NASA Worldview API request: lat={lat}, lon={lon}, date={date}, layers={layers}")
+        bundle = {}
+        for section, future in futures.items():
+            try:
+                present = NASA_PROXY_SPECS[sections[section][0]].get('present', _present_result)
+                bundle[section] = present(future.result())[0]
+            except Exception as e:
+                logger.error("NASA bundle %s section failed: %s", section, e)
+                bundle[section] = {'success': False, 'error': f'{section} data unavailable'}
         
-        # Call the Worldview service
-        result = get_worldview_image(lat, lon, date, layers, bbox_size)
+        return jsonify({
+            'success': all(part['success'] for part in bundle.values()),
+            'data': bundle
+        })
         
-        # Return appropriate HTTP status code
-        if result['success']:
-            return jsonify({
-                'success': True,
-                'date': result['date'],
-                'layers': result['layers'],
-                'image_url': result['image_url'],
-                'location': result['location'],
-                'bbox': result['bbox'],
-                'metadata': result['metadata']
-            })
-        else:
-            return jsonify({
-                'success': False,
-                'error': result['error'],
-                'image_url': None
-            }), 400
-            
     except Exception as e:
-        logger.error(f"Unexpected error in worldview-image endpoint: {str(e)}")
-        return jsonify({
-            'success': False,
-            'error': 'An unexpected error occurred while processing your request.',
-            'image_url': None
-        }), 500
+        logger.error(f"Unexpected error in nasa-bundle endpoint: {str(e)}")
+        return Response(_BUNDLE_ERROR_BODY, status=500, mimetype='application/json')
+
+# Browser/CDN max-age per endpoint; anything not listed gets no cache headers
+HTTP_CACHE_MAX_AGE = {
+    'api.get_power_data': 3600,
+    'api.get_gpm_precipitation_data': 3600,
+    'api.get_modis_air_quality_data': 3600,
+    'api.get_worldview_image_data': 3600,
+    'api.get_worldview_layers': 86400,
+    'api.get_current_conditions': 3600,
+    'api.get_risk_assessment': 3600,
+    'api.get_nasa_weather': 3600,
+    'api.get_imagery': 3600
+}
+HISTORICAL_MAX_AGE = 31536000
+
+@api_bp.after_request
+def add_http_cache_headers(response):
+    """Let clients and CDNs reuse deterministic GET responses"""
+    max_age = HTTP_CACHE_MAX_AGE.get(request.endpoint)
+    if max_age is None or request.method != 'GET' or response.status_code != 200 or response.is_streamed:
+        return response
 
-@api_bp.route('/worldview-layers')
+    response.cache_control.public = True
+    # Only the NASA proxies answer for the requested end/date; other routes ignore it
+    if request.endpoint in _PROXY_SPECS_BY_ENDPOINT and _archive_settled():
+        response.cache_control.max_age = HISTORICAL_MAX_AGE
+        response.cache_control.immutable = True
+    else:
+        response.cache_control.max_age = max_age
+    if not response.get_etag()[0]:
+        response.set_etag(hashlib.blake2b(response.get_data(), digest_size=16).hexdigest())
+    return response.make_conditional(request)
+
+@api_bp.route('/worldview-layers', methods=['GET'], strict_slashes=False)
 def get_worldview_layers():
     """
     Get available NASA Worldview layers.
@@ -371,22 +602,125 @@ def get_worldview_layers():
     Returns:
     - JSON with available layer information
     """
-    try:
-        layers = get_available_layers()
-        return jsonify({
-            'success': True,
-            'layers': layers,
-            'layer_count': len(layers)
-        })
-    except Exception as e:
-        logger.error(f"Error in worldview-layers endpoint: {str(e)}")
-        return jsonify({
-            'success': False,
-            'error': 'Failed to retrieve available layers',
-            'layers': {}
-        }), 500
+    response = Response(_LAYERS_BODY, mimetype='application/json')
+    response.set_etag(_LAYERS_ETAG)
+    return response
+
+_TEMPLATE_SLOT = '\x00slot\x00'
+
+def _json_template(payload, *slots):
+    """Serialize payload once, leaving holes where the named keys' values go
+
+    Returns the byte chunks between the holes; _fill_template() joins them
+    with the per-request values, so only those values are encoded per hit.
+    """
+    rendered = orjson.dumps({**payload, **dict.fromkeys(slots, _TEMPLATE_SLOT)}) + b'\n'
+    return rendered.split(orjson.dumps(_TEMPLATE_SLOT))
+
+def _fill_template(chunks, *values):
+    parts = [chunks[0]]
+    for value, chunk in zip(values, chunks[1:]):
+        parts.append(orjson.dumps(value))
+        parts.append(chunk)
+    return Response(b''.join(parts), mimetype='application/json')
+
+# Mock payloads for the dashboard; only the echoed location (and crop) vary
+_CURRENT_CONDITIONS_TEMPLATE = _json_template({
+    'success': True,
+    'location': None,
+    'current': {
+        'temperature': 22.5,
+        'humidity': 65,
+        'wind_speed': 12.3,
+        'wind_direction': 'NW',
+        'precipitation': 0.0,
+        'weather_description': 'Partly Cloudy',
+        'uv_index': 5,
+        'visibility': 10.0,
+        'pressure': 1013.25
+    },
+    'timestamp': '2025-10-02T10:00:00Z'
+}, 'location')
+
+_RISK_ASSESSMENT_TEMPLATE = _json_template({
+    'success': True,
+    'location': None,
+    'crop': None,
+    'overall_risk': 'Medium',
+    'risk_factors': {
+        'drought_risk': {
+            'level': 'Low',
+            'score': 2,
+            'description': 'Adequate rainfall expected'
+        },
+        'pest_risk': {
+            'level': 'Medium',
+            'score': 5,
+            'description': 'Moderate pest activity in region'
+        },
+        'weather_risk': {
+            'level': 'Medium',
+            'score': 4,
+            'description': 'Variable weather patterns'
+        },
+        'soil_risk': {
+            'level': 'Low',
+            'score': 3,
+            'description': 'Good soil conditions'
+        }
+    },
+    'recommendations': [
+        'Monitor pest activity regularly',
+        'Consider irrigation backup plans',
+        'Apply preventive treatments as needed'
+    ],
+    'forecast_period': '30 days',
+    'confidence': 85
+}, 'location', 'crop')
 
-@api_bp.route('/current-conditions')
+_NASA_WEATHER_TEMPLATE = _json_template({
+    'success': True,
+    'location': None,
+    'data_source': 'NASA POWER API',
+    'parameters': {
+        'temperature_2m': {
+            'value': 22.5,
+            'unit': '°C',
+            'description': 'Temperature at 2 meters'
+        },
+        'precipitation': {
+            'value': 2.3,
+            'unit': 'mm/day',
+            'description': 'Daily precipitation'
+        },
+        'solar_radiation': {
+            'value': 18.5,
+            'unit': 'MJ/m²/day',
+            'description': 'Solar irradiance'
+        },
+        'wind_speed': {
+            'value': 3.2,
+            'unit': 'm/s',
+            'description': 'Wind speed at 10 meters'
+        },
+        'humidity': {
+            'value': 65,
+            'unit': '%',
+            'description': 'Relative humidity'
+        }
+    },
+    'timestamp': '2025-10-02T10:00:00Z',
+    'quality': 'Good'
+}, 'location')
+
+def _echo_location():
+    """The request's lat/lon as the mock endpoints echo them (default: NYC)"""
+    return {
+        'latitude': float(request.args.get('lat', '40.7128')),
+        'longitude': float(request.args.get('lon', '-74.0060'))
+    }
+
+@api_bp.route('/current-conditions', methods=['GET'], strict_slashes=False)
 def get_current_conditions():
     """
     Get current weather conditions for a location.
@@ -399,31 +733,7 @@ def get_current_conditions():
     - JSON with current weather conditions
     """
     try:
-        lat = request.args.get('lat', '40.7128')  # Default to NYC
-        lon = request.args.get('lon', '-74.0060')
-        
-        # Mock current conditions data
-        current_conditions = {
-            'success': True,
-            'location': {
-                'latitude': float(lat),
-                'longitude': float(lon)
-            },
-            'current': {
-                'temperature': 22.5,
-                'humidity': 65,
-                'wind_speed': 12.3,
-                'wind_direction': 'NW',
-                'precipitation': 0.0,
-                'weather_description': 'Partly Cloudy',
-                'uv_index': 5,
-                'visibility': 10.0,
-                'pressure': 1013.25
-            },
-            'timestamp': '2025-10-02T10:00:00Z'
-        }
-        
-        return jsonify(current_conditions)
+        return _fill_template(_CURRENT_CONDITIONS_TEMPLATE, _echo_location())
     except Exception as e:
         logger.error(f"Error in current-conditions endpoint: {str(e)}")
         return jsonify({
@@ -431,7 +741,7 @@ def get_current_conditions():
             'error': 'Failed to retrieve current conditions'
         }), 500
 
-@api_bp.route('/risk-assessment')
+@api_bp.route('/risk-assessment', methods=['GET'], strict_slashes=False)
 def get_risk_assessment():
     """
     Get agricultural risk assessment for a location.
@@ -445,51 +755,9 @@ def get_risk_assessment():
     - JSON with risk assessment data
     """
     try:
-        lat = request.args.get('lat', '40.7128')
-        lon = request.args.get('lon', '-74.0060')
-        crop = request.args.get('crop', 'wheat')
-        
-        # Mock risk assessment data
-        risk_assessment = {
-            'success': True,
-            'location': {
-                'latitude': float(lat),
-                'longitude': float(lon)
-            },
-            'crop': crop,
-            'overall_risk': 'Medium',
-            'risk_factors': {
-                'drought_risk': {
-                    'level': 'Low',
-                    'score': 2,
-                    'description': 'Adequate rainfall expected'
-                },
-                'pest_risk': {
-                    'level': 'Medium',
-                    'score': 5,
-                    'description': 'Moderate pest activity in region'
-                },
-                'weather_risk': {
-                    'level': 'Medium',
-                    'score': 4,
-                    'description': 'Variable weather patterns'
-                },
-                'soil_risk': {
-                    'level': 'Low',
-                    'score': 3,
-                    'description': 'Good soil conditions'
-                }
-            },
-            'recommendations': [
-                'Monitor pest activity regularly',
-                'Consider irrigation backup plans',
-                'Apply preventive treatments as needed'
-            ],
-            'forecast_period': '30 days',
-            'confidence': 85
-        }
-        
-        return jsonify(risk_assessment)
+        return _fill_template(
+            _RISK_ASSESSMENT_TEMPLATE, _echo_location(), request.args.get('crop', 'wheat')
+        )
     except Exception as e:
         logger.error(f"Error in risk-assessment endpoint: {str(e)}")
         return jsonify({
@@ -497,7 +765,7 @@ def get_risk_assessment():
             'error': 'Failed to retrieve risk assessment'
         }), 500
 
-@api_bp.route('/nasa-weather')
+@api_bp.route('/nasa-weather', methods=['GET'], strict_slashes=False)
 def get_nasa_weather():
     """
     Get NASA weather data for predictions page.
@@ -510,49 +778,7 @@ def get_nasa_weather():
     - JSON with NASA weather data
     """
     try:
-        lat = request.args.get('lat', '40.7128')
-        lon = request.args.get('lon', '-74.0060')
-        
-        # Mock NASA weather data
-        nasa_weather = {
-            'success': True,
-            'location': {
-                'latitude': float(lat),
-                'longitude': float(lon)
-            },
-            'data_source': 'NASA POWER API',
-            'parameters': {
-                'temperature_2m': {
-                    'value': 22.5,
-                    'unit': '°C',
-                    'description': 'Temperature at 2 meters'
-                },
-                'precipitation': {
-                    'value': 2.3,
-                    'unit': 'mm/day',
-                    'description': 'Daily precipitation'
-                },
-                'solar_radiation': {
-                    'value': 18.5,
-                    'unit': 'MJ/m²/day',
-                    'description': 'Solar irradiance'
-                },
-                'wind_speed': {
-                    'value': 3.2,
-                    'unit': 'm/s',
-                    'description': 'Wind speed at 10 meters'
-                },
-                'humidity': {
-                    'value': 65,
-                    'unit': '%',
-                    'description': 'Relative humidity'
-                }
-            },
-            'timestamp': '2025-10-02T10:00:00Z',
-            'quality': 'Good'
-        }
-        
-        return jsonify(nasa_weather)
+        return _fill_template(_NASA_WEATHER_TEMPLATE, _echo_location())
     except Exception as e:
         logger.error(f"Error in nasa-weather endpoint: {str(e)}")
         return jsonify({
@@ -560,7 +786,153 @@ def get_nasa_weather():
             'error': 'Failed to retrieve NASA weather data'
         }), 500
 
-@api_bp.route('/predict', methods=['POST'])
+# Base yield estimates (tons per hectare) by crop
+BASE_YIELDS = {
+    'rice': 4.5,
+    'wheat': 3.2,
+    'corn': 5.8,
+    'maize': 5.8,
+    'soybean': 2.8,
+    'cotton': 1.2,
+    'sugarcane': 45.0,
+    'potato': 22.0,
+    'tomato': 35.0,
+    'onion': 18.0
+}
+DEFAULT_BASE_YIELD = 3.0
+
+SEASON_MULTIPLIERS = {
+    'kharif': 1.1,  # Monsoon season - good for rice
+    'rabi': 1.0,    # Winter season - good for wheat
+    'summer': 0.85   # Summer season - challenging
+}
+
+class PredictProfile(NamedTuple):
+    """Everything predict() derives from crop, season and latitude band"""
+    base_yield: float
+    risk_score: int
+    risk_level: str
+    risk_factors: tuple
+    recommendations: tuple
+
+def _build_predict_profile(crop, season, high_latitude):
+    """Apply the prediction rules once for a (crop, season, band) key
+
+    crop and season are None for values outside BASE_YIELDS and
+    SEASON_MULTIPLIERS, which get the defaults and no crop or season rules.
+    """
+    risk_factors = []
+    risk_score = 50  # Base risk score (50%)
+    
+    # Climate-based risk factors
+    if high_latitude:
+        risk_factors.append("High latitude - temperature extremes")
+        risk_score += 15
+    
+    if season == 'summer':
+        risk_factors.append("Summer season - water stress risk")
+        risk_score += 10
+    
+    # Crop-specific risks
+    if crop == 'rice' and season != 'kharif':
+        risk_factors.append("Rice grown outside monsoon season")
+        risk_score += 20
+    
+    if crop == 'wheat' and season == 'kharif':
+        risk_factors.append("Wheat in monsoon season - disease risk")
+        risk_score += 15
+    
+    # Cap risk score at 95%
+    risk_score = min(risk_score, 95)
+    
+    recommendations = []
+    
+    if risk_score > 70:
+        recommendations.append("Consider crop insurance due to high risk factors")
+        recommendations.append("Implement precision irrigation systems")
+        
+    if season == 'summer':
+        recommendations.append("Use drought-resistant varieties")
+        recommendations.append("Apply mulching to retain soil moisture")
+        
+    if crop == 'rice':
+        recommendations.append("Monitor water levels regularly")
+        recommendations.append("Use integrated pest management")
+        
+    if crop in ('wheat', 'corn'):
+        recommendations.append("Apply balanced fertilizer regimen")
+        recommendations.append("Monitor for fungal diseases")
+    
+    # Always include some general recommendations
+    recommendations.extend([
+        "Regular soil testing recommended",
+        "Monitor weather forecasts closely",
+        "Consider crop rotation for soil health"
+    ])
+    
+    return PredictProfile(
+        base_yield=BASE_YIELDS.get(crop, DEFAULT_BASE_YIELD) * SEASON_MULTIPLIERS.get(season, 1.0),
+        risk_score=risk_score,
+        risk_level='Low' if risk_score < 40 else 'Medium' if risk_score < 70 else 'High',
+        risk_factors=tuple(risk_factors),
+        recommendations=tuple(recommendations[:5])  # Limit to 5 recommendations
+    )
+
+# Every (crop, season, |lat| > 45) combination, built once at import
+_PREDICT_TABLE = {
+    (crop, season, high_latitude): _build_predict_profile(crop, season, high_latitude)
+    for crop in (*BASE_YIELDS, None)
+    for season in (*SEASON_MULTIPLIERS, None)
+    for high_latitude in (False, True)
+}
+
+def _predict_profile(crop, season, lat):
+    """Look up the precomputed profile for a prediction request"""
+    high_latitude = abs(lat) > 45
+    try:
+        return _PREDICT_TABLE[crop, season, high_latitude]
+    except KeyError:
+        return _PREDICT_TABLE[
+            crop if crop in BASE_YIELDS else None,
+            season if season in SEASON_MULTIPLIERS else None,
+            high_latitude
+        ]
+
+def _stable_seed(lat, lon, *labels):
+    """Seed for the simulated endpoints that is identical in every process
+
+    Built from crc32 over the packed coordinates and labels, so unlike
+    hash() it does not depend on PYTHONHASHSEED: every worker, and every
+    restart, generates the same data for the same inputs.
+    """
+    return zlib.crc32(struct.pack('<dd', lat, lon) + '|'.join(labels).encode())
+
+LOCATION_FORMAT_ERRORS = {
+    str: 'Location string must be in format "lat, lon"',
+    dict: 'Invalid latitude or longitude values'
+}
+
+def _parse_location(location):
+    """Return ({'lat', 'lon'}, None) for a predict location, or (None, error)
+
+    Accepts either a "lat, lon" string or an object with lat/lon keys; both go
+    through the same coercion and bounds checks as the query-string endpoints.
+    """
+    if isinstance(location, str):
+        parts = location.split(',')
+        if len(parts) != 2:
+            return None, LOCATION_FORMAT_ERRORS[str]
+        coords = dict(zip(('lat', 'lon'), parts))
+    elif isinstance(location, dict):
+        if 'lat' not in location or 'lon' not in location:
+            return None, 'Location object must include lat and lon coordinates'
+        coords = {'lat': location['lat'], 'lon': location['lon']}
+    else:
+        return None, 'Location must be either a string "lat, lon" or object with lat/lon properties'
+    error = _coerce_numbers(coords, ('lat', 'lon'), LOCATION_FORMAT_ERRORS[type(location)])
+    return (None, error) if error else (coords, None)
+
+@api_bp.route('/predict', methods=['POST'], strict_slashes=False)
 def predict():
     """
     Agricultural prediction endpoint for crop yield and risk assessment.
@@ -600,151 +972,32 @@ def predict():
                 'error': f'Missing required fields: {", ".join(missing_fields)}'
             }), 400
         
-        # Validate and parse location data
-        location = data.get('location')
-        
-        # Handle different location formats
-        if isinstance(location, str):
-            # Handle comma-separated string format: "lat, lon"
-            try:
-                parts = location.split(',')
-                if len(parts) != 2:
-                    raise ValueError("Invalid location format")
-                lat = float(parts[0].strip())
-                lon = float(parts[1].strip())
-            except (ValueError, IndexError):
-                return jsonify({
-                    'success': False,
-                    'error': 'Location string must be in format "lat, lon"'
-                }), 400
-        elif isinstance(location, dict):
-            # Handle object format: {"lat": float, "lon": float}
-            if 'lat' not in location or 'lon' not in location:
-                return jsonify({
-                    'success': False,
-                    'error': 'Location object must include lat and lon coordinates'
-                }), 400
-            try:
-                lat = float(location['lat'])
-                lon = float(location['lon'])
-            except (ValueError, TypeError):
-                return jsonify({
-                    'success': False,
-                    'error': 'Invalid latitude or longitude values'
-                }), 400
-        else:
+        coords, error = _parse_location(data.get('location'))
+        if error:
             return jsonify({
                 'success': False,
-                'error': 'Location must be either a string "lat, lon" or object with lat/lon properties'
-            }), 400
-        
-        # Validate coordinate ranges
-        if not (-90 <= lat <= 90):
-            return jsonify({
-                'success': False,
-                'error': 'Latitude must be between -90 and 90 degrees'
-            }), 400
-        
-        if not (-180 <= lon <= 180):
-            return jsonify({
-                'success': False,
-                'error': 'Longitude must be between -180 and 180 degrees'
+                'error': error
             }), 400
+        lat, lon = coords['lat'], coords['lon']
         
         crop = data.get('crop', '').lower()
         season = data.get('season', '').lower()
         area = data.get('area', 1.0)  # Default 1 hectare
         
-        # Simulate agricultural prediction based on crop and season
-        # In a real implementation, this would use ML models and NASA data
-        
-        # Base yield estimates (tons per hectare) by crop
-        base_yields = {
-            'rice': 4.5,
-            'wheat': 3.2,
-            'corn': 5.8,
-            'maize': 5.8,
-            'soybean': 2.8,
-            'cotton': 1.2,
-            'sugarcane': 45.0,
-            'potato': 22.0,
-            'tomato': 35.0,
-            'onion': 18.0
-        }
-        
-        # Season multipliers
-        season_multipliers = {
-            'kharif': 1.1,  # Monsoon season - good for rice
-            'rabi': 1.0,    # Winter season - good for wheat
-            'summer': 0.85   # Summer season - challenging
-        }
-        
-        # Get base yield
-        base_yield = base_yields.get(crop, 3.0)  # Default 3 tons/hectare
-        season_multiplier = season_multipliers.get(season, 1.0)
+        profile = _predict_profile(crop, season, lat)
         
         # Calculate predicted yield with some randomness for realism
-        import random
-        random.seed(hash(f"{crop}{season}{lat}{lon}"))  # Consistent results for same inputs
-        yield_variance = random.uniform(0.8, 1.2)
-        predicted_yield_per_hectare = base_yield * season_multiplier * yield_variance
+        rng = random.Random(_stable_seed(lat, lon, crop, season))  # Consistent results for same inputs
+        yield_variance = rng.uniform(0.8, 1.2)
+        predicted_yield_per_hectare = profile.base_yield * yield_variance
         total_predicted_yield = predicted_yield_per_hectare * area
         
-        # Risk assessment
-        risk_factors = []
-        risk_score = 50  # Base risk score (50%)
-        
-        # Climate-based risk factors
-        if abs(lat) > 45:
-            risk_factors.append("High latitude - temperature extremes")
-            risk_score += 15
-        
-        if season == 'summer':
-            risk_factors.append("Summer season - water stress risk")
-            risk_score += 10
-        
-        # Crop-specific risks
-        if crop in ['rice'] and season != 'kharif':
-            risk_factors.append("Rice grown outside monsoon season")
-            risk_score += 20
-        
-        if crop in ['wheat'] and season == 'kharif':
-            risk_factors.append("Wheat in monsoon season - disease risk")
-            risk_score += 15
-        
-        # Cap risk score at 95%
-        risk_score = min(risk_score, 95)
-        
-        # Generate recommendations
-        recommendations = []
-        
-        if risk_score > 70:
-            recommendations.append("Consider crop insurance due to high risk factors")
-            recommendations.append("Implement precision irrigation systems")
-            
-        if season == 'summer':
-            recommendations.append("Use drought-resistant varieties")
-            recommendations.append("Apply mulching to retain soil moisture")
-            
-        if crop == 'rice':
-            recommendations.append("Monitor water levels regularly")
-            recommendations.append("Use integrated pest management")
-            
-        if crop in ['wheat', 'corn']:
-            recommendations.append("Apply balanced fertilizer regimen")
-            recommendations.append("Monitor for fungal diseases")
-        
-        # Always include some general recommendations
-        recommendations.extend([
-            "Regular soil testing recommended",
-            "Monitor weather forecasts closely",
-            "Consider crop rotation for soil health"
-        ])
-        
         # Prepare response
-        location_name = f"Location ({lat:.2f}, {lon:.2f})"
-        if isinstance(data.get('location'), dict) and 'name' in data.get('location'):
-            location_name = data.get('location')['name']
+        location = data['location']
+        if isinstance(location, dict) and 'name' in location:
+            location_name = location['name']
+        else:
+            location_name = f"Location ({lat:.2f}, {lon:.2f})"
         
         prediction_result = {
             'success': True,
@@ -763,17 +1016,17 @@ def predict():
                     'unit': 'tons'
                 },
                 'risk_assessment': {
-                    'score': risk_score,
-                    'level': 'Low' if risk_score < 40 else 'Medium' if risk_score < 70 else 'High',
-                    'factors': risk_factors
+                    'score': profile.risk_score,
+                    'level': profile.risk_level,
+                    'factors': list(profile.risk_factors)
                 },
-                'recommendations': recommendations[:5],  # Limit to 5 recommendations
-                'confidence': round(random.uniform(0.75, 0.95), 2),
+                'recommendations': list(profile.recommendations),
+                'confidence': round(rng.uniform(0.75, 0.95), 2),
                 'generated_at': '2025-10-02T10:22:40Z'
             }
         }
         
-        logger.info(f"Generated prediction for {crop} in {season} season at ({lat}, {lon})")
+        logger.info("Generated prediction for %s in %s season at (%s, %s)", crop, season, lat, lon)
         return jsonify(prediction_result)
         
     except Exception as e:
@@ -783,7 +1036,8 @@ def predict():
             'error': 'Failed to generate prediction'
         }), 500
 
-@api_bp.route('/weather-data')
+@api_bp.route('/weather-data', methods=['GET'], strict_slashes=False)
+@cached_response(timeout=3600)
 def get_weather_data():
     """
     Get current weather data for dashboard display.
@@ -794,50 +1048,52 @@ def get_weather_data():
     
     Returns:
     - JSON with current weather conditions and forecasts
+    
+    The payload is seeded from the coordinates alone, so it is cached per
+    lat/lon instead of regenerating the forecast on every dashboard refresh.
     """
     try:
         # Get coordinates (default to New Delhi if not provided)
-        lat = float(request.args.get('lat', 28.6139))
-        lon = float(request.args.get('lon', 77.2090))
+        lat = request.args.get('lat', 28.6139, type=_parse_number)
+        lon = request.args.get('lon', 77.2090, type=_parse_number)
         
-        # Validate coordinate ranges
-        if not (-90 <= lat <= 90) or not (-180 <= lon <= 180):
+        # Validate coordinate ranges (None means the value was not a number)
+        if lat is None or lon is None or not (-90 <= lat <= 90) or not (-180 <= lon <= 180):
             return jsonify({
                 'success': False,
                 'error': 'Invalid coordinates'
             }), 400
         
         # Simulate weather data (in production, use real weather API)
-        import random
-        random.seed(hash(f"{lat}{lon}"))  # Consistent results for same location
+        rng = random.Random(_stable_seed(lat, lon))  # Consistent results for same location
         
         # Generate realistic weather data
         base_temp = 25 + (lat / 90) * 15  # Temperature varies with latitude
-        current_temp = base_temp + random.uniform(-5, 5)
+        current_temp = base_temp + rng.uniform(-5, 5)
         
         weather_conditions = ['Clear', 'Partly Cloudy', 'Cloudy', 'Light Rain', 'Overcast']
-        condition = random.choice(weather_conditions)
+        condition = rng.choice(weather_conditions)
         
-        humidity = random.randint(40, 90)
-        wind_speed = random.uniform(2, 15)
-        pressure = random.uniform(1010, 1025)
+        humidity = rng.randint(40, 90)
+        wind_speed = rng.uniform(2, 15)
+        pressure = rng.uniform(1010, 1025)
         
         # Generate 7-day forecast
         forecast = []
         for i in range(7):
-            day_temp = base_temp + random.uniform(-8, 8)
-            day_condition = random.choice(weather_conditions)
-            rainfall = random.uniform(0, 10) if 'Rain' in day_condition else 0
+            day_temp = base_temp + rng.uniform(-8, 8)
+            day_condition = rng.choice(weather_conditions)
+            rainfall = rng.uniform(0, 10) if 'Rain' in day_condition else 0
             
             forecast.append({
                 'day': f"Day {i+1}",
                 'temperature': {
-                    'max': round(day_temp + random.uniform(2, 6), 1),
-                    'min': round(day_temp - random.uniform(2, 6), 1)
+                    'max': round(day_temp + rng.uniform(2, 6), 1),
+                    'min': round(day_temp - rng.uniform(2, 6), 1)
                 },
                 'condition': day_condition,
                 'rainfall': round(rainfall, 1),
-                'humidity': random.randint(35, 85)
+                'humidity': rng.randint(35, 85)
             })
         
         weather_data = {
@@ -853,7 +1109,7 @@ def get_weather_data():
                 'humidity': humidity,
                 'wind_speed': round(wind_speed, 1),
                 'pressure': round(pressure, 1),
-                'feels_like': round(current_temp + random.uniform(-2, 2), 1)
+                'feels_like': round(current_temp + rng.uniform(-2, 2), 1)
             },
             'forecast': forecast,
             'alerts': [],
@@ -879,7 +1135,7 @@ def get_weather_data():
                 'message': 'Strong winds - Secure farming equipment'
             })
         
-        logger.info(f"Generated weather data for location ({lat}, {lon})")
+        logger.info("Generated weather data for location (%s, %s)", lat, lon)
         return jsonify(weather_data)
         
     except Exception as e:
@@ -889,7 +1145,76 @@ def get_weather_data():
             'error': 'Failed to retrieve weather data'
         }), 500
 
-@api_bp.route('/imagery/<string:imagery_type>')
+# Map frontend imagery types to NASA Worldview layer names
+IMAGERY_LAYERS = {
+    'true_color': 'MODIS_Terra_CorrectedReflectance_TrueColor',
+    'vegetation': 'MODIS_Terra_NDVI_8Day',
+    'temperature': 'MODIS_Terra_Land_Surface_Temp_Day',
+    'moisture': 'SMAP_L3_Passive_Soil_Moisture_Active'
+}
+IMAGERY_SNAPSHOT_URL = (
+    'https://worldview.earthdata.nasa.gov/api/v1/snapshot?REQUEST=GetSnapshot&FORMAT=image/jpeg'
+    '&WIDTH=400&HEIGHT=400&LAYERS={layer}&CRS=EPSG:4326&BBOX=-180,-90,180,90&TIME={date}'
+)
+IMAGERY_GIBS_URL = 'https://gibs.earthdata.nasa.gov/wmts/epsg4326/best/{layer}/default/{date}/250m/0/0/0.jpg'
+IMAGERY_PLACEHOLDER_URL = 'https://via.placeholder.com/400x400/2563EB/FFFFFF?text={label}+Data'
+
+# Imagery probes carry Earthdata credentials, so they get their own pooled
+# session: a bearer token if available, otherwise basic auth
+_imagery_session = pooled_session(pool_size=8)
+_EARTHDATA_TOKEN = os.getenv('earth_data_bearer_token')
+if _EARTHDATA_TOKEN:
+    _imagery_session.headers['Authorization'] = f'Bearer {_EARTHDATA_TOKEN}'
+else:
+    _earthdata_user = os.getenv('EARTHDATA_USER', os.getenv('earth_data_username'))
+    _earthdata_pass = os.getenv('EARTHDATA_PASS', os.getenv('earth_data_password'))
+    if _earthdata_user and _earthdata_pass:
+        _imagery_session.auth = (_earthdata_user, _earthdata_pass)
+
+# Snapshots are published daily, so a probed URL holds for at least an hour
+IMAGERY_URL_TTL = 3600
+# HEAD requests return no body; a slow answer means the host is struggling
+IMAGERY_PROBE_TIMEOUT = 5
+# (layer, date) -> (expires_at, url or None when neither source had it)
+_imagery_urls = {}
+
+def _probe_imagery_url(layer_name, date):
+    """Return the Worldview snapshot if it exists, else the GIBS tile if that does
+
+    Both HEAD probes run at once, so the fallback costs no extra round trip.
+    """
+    candidates = (
+        IMAGERY_SNAPSHOT_URL.format(layer=layer_name, date=date),
+        # NASA GIBS tile service as alternative
+        IMAGERY_GIBS_URL.format(layer=layer_name, date=date)
+    )
+    probes = [
+        _fanout_pool.submit(_imagery_session.head, url, timeout=IMAGERY_PROBE_TIMEOUT)
+        for url in candidates
+    ]
+    for url, probe in zip(candidates, probes):
+        if probe.result().status_code == 200:
+            return url
+    return None
+
+def _resolve_imagery_url(layer_name, date):
+    """Cached _probe_imagery_url; concurrent misses share one probe
+
+    Network errors propagate and are not cached, so the next request retries.
+    """
+    key = (layer_name, date)
+    now = time.monotonic()
+    entry = _imagery_urls.get(key)
+    if entry and entry[0] > now:
+        return entry[1]
+    url = coalesce_calls(('imagery', *key), _probe_imagery_url, layer_name, date)
+    # Yesterday's entries never hit again; drop expired ones as new ones land
+    for stale in [k for k, (expires_at, _) in list(_imagery_urls.items()) if expires_at <= now]:
+        _imagery_urls.pop(stale, None)
+    _imagery_urls[key] = (now + IMAGERY_URL_TTL, url)
+    return url
+
+@api_bp.route('/imagery/<string:imagery_type>', methods=['GET'], strict_slashes=False)
 def get_imagery(imagery_type):
     """
     Get NASA Worldview imagery for different types.
@@ -901,80 +1226,24 @@ def get_imagery(imagery_type):
     - JSON with imagery URL and metadata
     """
     try:
-        # Map frontend imagery types to NASA Worldview layer names
-        layer_mapping = {
-            'true_color': 'MODIS_Terra_CorrectedReflectance_TrueColor',
-            'vegetation': 'MODIS_Terra_NDVI_8Day',
-            'temperature': 'MODIS_Terra_Land_Surface_Temp_Day',
-            'moisture': 'SMAP_L3_Passive_Soil_Moisture_Active'
-        }
-        
-        if imagery_type not in layer_mapping:
+        layer_name = IMAGERY_LAYERS.get(imagery_type)
+        if layer_name is None:
             return jsonify({
                 'success': False,
                 'error': f'Invalid imagery type: {imagery_type}'
             }), 400
         
-        layer_name = layer_mapping[imagery_type]
-        
         # Get current date for imagery
-        from datetime import datetime
         current_date = datetime.now().strftime('%Y-%m-%d')
-        
-        # Build NASA Worldview snapshot URL
-        base_url = 'https://worldview.earthdata.nasa.gov/api/v1/snapshot'
-        params = {
-            'REQUEST': 'GetSnapshot',
-            'FORMAT': 'image/jpeg',
-            'WIDTH': '400',
-            'HEIGHT': '400',
-            'LAYERS': layer_name,
-            'CRS': 'EPSG:4326',
-            'BBOX': '-180,-90,180,90',
-            'TIME': current_date
-        }
-        
-        param_string = '&'.join([f'{k}={v}' for k, v in params.items()])
-        nasa_url = f'{base_url}?{param_string}'
-        
-        # Try to fetch the image using NASA Earthdata credentials
-        import requests
-        import os
-        
-        # Get NASA Earthdata credentials from environment
-        earthdata_user = os.getenv('EARTHDATA_USER', os.getenv('earth_data_username'))
-        earthdata_pass = os.getenv('EARTHDATA_PASS', os.getenv('earth_data_password'))
-        bearer_token = os.getenv('earth_data_bearer_token')
+        placeholder_url = IMAGERY_PLACEHOLDER_URL.format(label=imagery_type.replace("_", "+").title())
         
         try:
-            # Use bearer token if available, otherwise basic auth
-            headers = {}
-            auth = None
-            
-            if bearer_token:
-                headers['Authorization'] = f'Bearer {bearer_token}'
-            elif earthdata_user and earthdata_pass:
-                auth = (earthdata_user, earthdata_pass)
-            
-            # Test the NASA URL with authentication
-            response = requests.head(nasa_url, headers=headers, auth=auth, timeout=10)
-            
-            if response.status_code == 200:
-                image_url = nasa_url
-            else:
-                # Try NASA GIBS tile service as alternative
-                gibs_url = f'https://gibs.earthdata.nasa.gov/wmts/epsg4326/best/{layer_name}/default/{current_date}/250m/0/0/0.jpg'
-                gibs_response = requests.head(gibs_url, headers=headers, auth=auth, timeout=10)
-                
-                if gibs_response.status_code == 200:
-                    image_url = gibs_url
-                else:
-                    # Fallback to working demo image
-                    image_url = f'https://via.placeholder.com/400x400/2563EB/FFFFFF?text={imagery_type.replace("_", "+").title()}+Data'
+            # Falls back to a demo image when neither NASA source has the layer
+            image_url = _resolve_imagery_url(layer_name, current_date) or placeholder_url
         except Exception as e:
-            logger.warning(f"Failed to access NASA imagery: {str(e)}")
+            logger.warning("Failed to access NASA imagery: %s", e)
             # Use fallback image
-            image_url = f'https://via.placeholder.com/400x400/2563EB/FFFFFF?text={imagery_type.replace("_", "+").title()}+Data'
+            image_url = placeholder_url
         
         imagery_data = {
             'success': True,
@@ -985,11 +1254,16 @@ def get_imagery(imagery_type):
             'source': 'NASA Worldview',
             'description': f'{imagery_type.replace("_", " ").title()} satellite imagery',
             'resolution': '400x400',
-            'timestamp': datetime.now().isoformat() + 'Z',
+            'timestamp': iso_now(),
             'bbox': '-180,-90,180,90'
         }
         
-        return jsonify(imagery_data)
+        response = jsonify(imagery_data)
+        # The body carries a per-second timestamp; key the validator on the image itself
+        response.set_etag(hashlib.blake2b(
+            f'{image_url}|{layer_name}|{current_date}'.encode(), digest_size=16
+        ).hexdigest(), weak=True)
+        return response
     except Exception as e:
         logger.error(f"Error in imagery endpoint: {str(e)}")
         return jsonify({
@@ -997,7 +1271,37 @@ def get_imagery(imagery_type):
             'error': f'Failed to retrieve {imagery_type} imagery'
         }), 500
 
-@api_bp.route('/air-quality')
+# Mock air quality data - in production, this would integrate with MODIS data
+_AIR_QUALITY_TEMPLATE = _json_template({
+    'success': True,
+    'location': None,
+    'data_source': 'MODIS Terra/Aqua',
+    'pm25': 12.5,  # μg/m³
+    'pm10': 18.7,  # μg/m³
+    'aod': 0.15,   # Aerosol Optical Depth
+    'air_quality_index': 45,
+    'quality_level': 'Good',
+    'timestamp': '2025-10-02T10:00:00Z',
+    'parameters': {
+        'pm25': {
+            'value': 12.5,
+            'unit': 'μg/m³',
+            'description': 'Particulate matter 2.5 micrometers'
+        },
+        'pm10': {
+            'value': 18.7,
+            'unit': 'μg/m³',
+            'description': 'Particulate matter 10 micrometers'
+        },
+        'aod': {
+            'value': 0.15,
+            'unit': 'unitless',
+            'description': 'Aerosol Optical Depth at 550nm'
+        }
+    }
+}, 'location')
+
+@api_bp.route('/air-quality', methods=['GET'], strict_slashes=False)
 def get_air_quality():
     """
     Get air quality data from MODIS.
@@ -1010,43 +1314,7 @@ def get_air_quality():
     - JSON with air quality parameters
     """
     try:
-        lat = request.args.get('lat', '40.7128')
-        lon = request.args.get('lon', '-74.0060')
-        
-        # Mock air quality data - in production, this would integrate with MODIS data
-        air_quality = {
-            'success': True,
-            'location': {
-                'latitude': float(lat),
-                'longitude': float(lon)
-            },
-            'data_source': 'MODIS Terra/Aqua',
-            'pm25': 12.5,  # μg/m³
-            'pm10': 18.7,  # μg/m³
-            'aod': 0.15,   # Aerosol Optical Depth
-            'air_quality_index': 45,
-            'quality_level': 'Good',
-            'timestamp': '2025-10-02T10:00:00Z',
-            'parameters': {
-                'pm25': {
-                    'value': 12.5,
-                    'unit': 'μg/m³',
-                    'description': 'Particulate matter 2.5 micrometers'
-                },
-                'pm10': {
-                    'value': 18.7,
-                    'unit': 'μg/m³',
-                    'description': 'Particulate matter 10 micrometers'
-                },
-                'aod': {
-                    'value': 0.15,
-                    'unit': 'unitless',
-                    'description': 'Aerosol Optical Depth at 550nm'
-                }
-            }
-        }
-        
-        return jsonify(air_quality)
+        return _fill_template(_AIR_QUALITY_TEMPLATE, _echo_location())
     except Exception as e:
         logger.error(f"Error in air-quality endpoint: {str(e)}")
         return jsonify({
@@ -1054,7 +1322,22 @@ def get_air_quality():
             'error': 'Failed to retrieve air quality data'
         }), 500
 
-@api_bp.route('/historical-data')
+# Mock historical data - in production, this would aggregate actual historical data
+_HISTORICAL_DATA_TEMPLATE = _json_template({
+    'success': True,
+    'location': None,
+    'period_days': None,
+    'temp_avg': 21.3,      # °C
+    'temp_min': 16.2,      # °C
+    'temp_max': 26.8,      # °C
+    'precip_week': 15.4,   # mm total
+    'humidity_avg': 68,    # %
+    'wind_speed_avg': 3.8, # m/s
+    'data_source': 'NASA POWER API Historical',
+    'timestamp': '2025-10-02T10:00:00Z'
+}, 'location', 'period_days')
+
+@api_bp.route('/historical-data', methods=['GET'], strict_slashes=False)
 def get_historical_data():
     """
     Get historical weather trends.
@@ -1068,29 +1351,8 @@ def get_historical_data():
     - JSON with historical weather trends
     """
     try:
-        lat = request.args.get('lat', '40.7128')
-        lon = request.args.get('lon', '-74.0060')
         days = int(request.args.get('days', 7))
-        
-        # Mock historical data - in production, this would aggregate actual historical data
-        historical_data = {
-            'success': True,
-            'location': {
-                'latitude': float(lat),
-                'longitude': float(lon)
-            },
-            'period_days': days,
-            'temp_avg': 21.3,      # °C
-            'temp_min': 16.2,      # °C
-            'temp_max': 26.8,      # °C
-            'precip_week': 15.4,   # mm total
-            'humidity_avg': 68,    # %
-            'wind_speed_avg': 3.8, # m/s
-            'data_source': 'NASA POWER API Historical',
-            'timestamp': '2025-10-02T10:00:00Z'
-        }
-        
-        return jsonify(historical_data)
+        return _fill_template(_HISTORICAL_DATA_TEMPLATE, _echo_location(), days)
     except Exception as e:
         logger.error(f"Error in historical-data endpoint: {str(e)}")
         return jsonify({
@@ -1098,7 +1360,46 @@ def get_historical_data():
             'error': 'Failed to retrieve historical data'
         }), 500
 
-@api_bp.route('/export-data')
+# Mock JSON export; export_data() fills in the format and location
+_EXPORT_DATA_TEMPLATE = {
+    'success': True,
+    'export_format': None,
+    'location': None,
+    'data': {
+        'current_conditions': {
+            'temperature': 22.5,
+            'humidity': 65,
+            'wind_speed': 3.2,
+            'precipitation': 0.0
+        },
+        'historical_averages': {
+            'temp_7d': 21.3,
+            'precip_7d': 15.4
+        }
+    },
+    'timestamp': '2025-10-02T10:00:00Z',
+    'source': 'NASA APIs (POWER, MODIS, GPM)'
+}
+
+def _csv_body(header, rows):
+    """Render rows as CSV in one pass; csv.writer quotes embedded commas"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    writer.writerow(header)
+    writer.writerows(rows)
+    return buffer.getvalue()
+
+# Mock CSV export; static, so rendered once
+_EXPORT_CSV_BODY = _csv_body(
+    ('timestamp', 'temperature', 'humidity', 'wind_speed', 'precipitation'),
+    (
+        ('2025-10-02T10:00:00Z', 22.5, 65, 3.2, 0.0),
+        ('2025-10-02T09:00:00Z', 21.8, 67, 3.1, 0.2),
+        ('2025-10-02T08:00:00Z', 20.9, 70, 2.8, 0.5)
+    )
+)
+
+@api_bp.route('/export-data', methods=['GET'], strict_slashes=False)
 def export_data():
     """
     Export NASA data in various formats.
@@ -1117,48 +1418,18 @@ def export_data():
         lon = request.args.get('lon', '-74.0060')
         
         if format_type == 'csv':
-            # Mock CSV data
-            csv_data = "timestamp,temperature,humidity,wind_speed,precipitation\n"
-            csv_data += "2025-10-02T10:00:00Z,22.5,65,3.2,0.0\n"
-            csv_data += "2025-10-02T09:00:00Z,21.8,67,3.1,0.2\n"
-            csv_data += "2025-10-02T08:00:00Z,20.9,70,2.8,0.5\n"
-            
-            from flask import Response
             return Response(
-                csv_data,
+                _EXPORT_CSV_BODY,
                 mimetype='text/csv',
                 headers={'Content-Disposition': f'attachment; filename=nasa_data_{lat}_{lon}.csv'}
             )
         else:
-            # JSON export
-            export_data = {
-                'success': True,
-                'export_format': format_type,
-                'location': {
-                    'latitude': float(lat),
-                    'longitude': float(lon)
-                },
-                'data': {
-                    'current_conditions': {
-                        'temperature': 22.5,
-                        'humidity': 65,
-                        'wind_speed': 3.2,
-                        'precipitation': 0.0
-                    },
-                    'historical_averages': {
-                        'temp_7d': 21.3,
-                        'precip_7d': 15.4
-                    }
-                },
-                'timestamp': '2025-10-02T10:00:00Z',
-                'source': 'NASA APIs (POWER, MODIS, GPM)'
-            }
+            # JSON export; key order follows the template
+            export_data = {**_EXPORT_DATA_TEMPLATE, 'export_format': format_type, 'location': _echo_location()}
             
             if format_type == 'json':
-                from flask import Response
-                import json
                 return Response(
-                    json.dumps(export_data, indent=2),
+                    orjson.dumps(export_data, option=orjson.OPT_INDENT_2),
                     mimetype='application/json',
                     headers={'Content-Disposition': f'attachment; filename=nasa_data_{lat}_{lon}.json'}
                 )
@@ -1172,7 +1443,7 @@ def export_data():
             'error': 'Failed to export data'
         }), 500
 
-@api_bp.route('/weather-risk-analysis', methods=['POST'])
+@api_bp.route('/weather-risk-analysis', methods=['POST'], strict_slashes=False)
 def weather_risk_analysis():
     """
     Comprehensive weather risk analysis for outdoor activities.
@@ -1217,7 +1488,6 @@ def weather_risk_analysis():
             }), 400
         
         # Calculate date range
-        from datetime import datetime, timedelta
         try:
             start = datetime.strptime(start_date, '%Y-%m-%d')
             end = datetime.strptime(end_date, '%Y-%m-%d')
@@ -1263,7 +1533,7 @@ def weather_risk_analysis():
                 'MERRA-2 - Atmospheric reanalysis'
             ],
             'metadata': {
-                'analysis_date': datetime.now().isoformat(),
+                'analysis_date': iso_now(),
                 'coordinates': {'latitude': lat, 'longitude': lon},
                 'units': {
                     'temperature': 'Celsius',
@@ -1274,7 +1544,7 @@ def weather_risk_analysis():
             }
         }
         
-        logger.info(f"Weather risk analysis completed for location ({lat}, {lon}) with {len(conditions)} conditions")
+        logger.info("Weather risk analysis completed for location (%s, %s) with %d conditions", lat, lon, len(conditions))
         return jsonify(response_data)
         
     except Exception as e:
@@ -1305,44 +1575,45 @@ def parse_location_coordinates(location, coordinates):
     except (ValueError, TypeError):
         return None, None
 
+# Simulated historical base rate per condition, before location and season
+CONDITION_BASE_PROBABILITIES = {
+    'very_hot': 0.25,
+    'very_cold': 0.15,
+    'very_windy': 0.30,
+    'very_wet': 0.35,
+    'uncomfortable': 0.40,
+    'poor_air': 0.20
+}
+# (climate zone, condition) -> adjustment; zones come from |lat|
+CLIMATE_ZONE_ADJUSTMENTS = {
+    ('polar', 'very_cold'): 0.3,
+    ('polar', 'very_hot'): -0.2,
+    ('tropical', 'very_hot'): 0.2,
+    ('tropical', 'very_wet'): 0.15,
+    ('tropical', 'very_cold'): -0.2
+}
+# (condition, month) -> (latitude it must exceed, adjustment); simplified
+# Northern Hemisphere summer heat and winter cold
+SEASON_ADJUSTMENTS = {
+    **{('very_hot', month): (0, 0.15) for month in (6, 7, 8)},
+    **{('very_cold', month): (30, 0.2) for month in (12, 1, 2)}
+}
+
+def _climate_zone(lat):
+    if abs(lat) > 60:  # Arctic/Antarctic
+        return 'polar'
+    if abs(lat) < 23.5:
+        return 'tropical'
+    return 'temperate'
+
 def calculate_condition_probability(condition, lat, lon, start_date, end_date):
     """Calculate probability of weather condition based on location and time period."""
-    import random
-    
-    # Simulate historical analysis based on location and season
-    base_probabilities = {
-        'very_hot': 0.25,
-        'very_cold': 0.15,
-        'very_windy': 0.30,
-        'very_wet': 0.35,
-        'uncomfortable': 0.40,
-        'poor_air': 0.20
-    }
-    
-    base_prob = base_probabilities.get(condition, 0.25)
-    
-    # Adjust based on latitude (climate zones)
-    if abs(lat) > 60:  # Arctic/Antarctic
-        if condition == 'very_cold':
-            base_prob += 0.3
-        elif condition == 'very_hot':
-            base_prob -= 0.2
-    elif abs(lat) < 23.5:  # Tropical
-        if condition == 'very_hot':
-            base_prob += 0.2
-        elif condition == 'very_wet':
-            base_prob += 0.15
-        elif condition == 'very_cold':
-            base_prob -= 0.2
+    base_prob = CONDITION_BASE_PROBABILITIES.get(condition, 0.25)
+    base_prob += CLIMATE_ZONE_ADJUSTMENTS.get((_climate_zone(lat), condition), 0.0)
     
-    # Adjust based on season (simplified)
-    month = start_date.month
-    if condition == 'very_hot' and month in [6, 7, 8]:  # Summer (Northern Hemisphere)
-        if lat > 0:
-            base_prob += 0.15
-    elif condition == 'very_cold' and month in [12, 1, 2]:  # Winter
-        if lat > 30:
-            base_prob += 0.2
+    season = SEASON_ADJUSTMENTS.get((condition, start_date.month))
+    if season and lat > season[0]:
+        base_prob += season[1]
     
     # Add some randomness for realistic variation
     probability = base_prob + random.uniform(-0.1, 0.1)
@@ -1350,49 +1621,49 @@ def calculate_condition_probability(condition, lat, lon, start_date, end_date):
     # Ensure probability is between 0 and 1
     return max(0.0, min(1.0, probability))
 
+CONDITION_DESCRIPTIONS = {
+    'very_hot': "Temperature above 35°C expected {:.0f}% of the time",
+    'very_cold': "Temperature below 5°C expected {:.0f}% of the time",
+    'very_windy': "Wind speeds above 25 km/h expected {:.0f}% of the time",
+    'very_wet': "Precipitation above 10mm expected {:.0f}% of the time",
+    'uncomfortable': "Heat index indicating discomfort expected {:.0f}% of the time",
+    'poor_air': "Air quality below good standards expected {:.0f}% of the time"
+}
+
 def get_condition_description(condition, probability):
     """Get human-readable description for weather condition probability."""
-    prob_percent = probability * 100
-    
-    descriptions = {
-        'very_hot': f"Temperature above 35°C expected {prob_percent:.0f}% of the time",
-        'very_cold': f"Temperature below 5°C expected {prob_percent:.0f}% of the time", 
-        'very_windy': f"Wind speeds above 25 km/h expected {prob_percent:.0f}% of the time",
-        'very_wet': f"Precipitation above 10mm expected {prob_percent:.0f}% of the time",
-        'uncomfortable': f"Heat index indicating discomfort expected {prob_percent:.0f}% of the time",
-        'poor_air': f"Air quality below good standards expected {prob_percent:.0f}% of the time"
-    }
-    
-    return descriptions.get(condition, f"Condition probability: {prob_percent:.0f}%")
+    template = CONDITION_DESCRIPTIONS.get(condition, "Condition probability: {:.0f}%")
+    return template.format(probability * 100)
+
+CONDITION_THRESHOLDS = {
+    'very_hot': {'value': 35, 'unit': '°C', 'description': 'Maximum temperature'},
+    'very_cold': {'value': 5, 'unit': '°C', 'description': 'Minimum temperature'},
+    'very_windy': {'value': 25, 'unit': 'km/h', 'description': 'Wind speed'},
+    'very_wet': {'value': 10, 'unit': 'mm', 'description': 'Daily precipitation'},
+    'uncomfortable': {'value': 'Variable', 'unit': 'Heat Index', 'description': 'Based on temperature and humidity'},
+    'poor_air': {'value': 'AQI > 100', 'unit': 'AQI', 'description': 'Air Quality Index'}
+}
+UNDEFINED_THRESHOLD = {'value': 'N/A', 'unit': '', 'description': 'Threshold not defined'}
 
 def get_condition_threshold(condition):
     """Get the threshold values for each weather condition."""
-    thresholds = {
-        'very_hot': {'value': 35, 'unit': '°C', 'description': 'Maximum temperature'},
-        'very_cold': {'value': 5, 'unit': '°C', 'description': 'Minimum temperature'},
-        'very_windy': {'value': 25, 'unit': 'km/h', 'description': 'Wind speed'},
-        'very_wet': {'value': 10, 'unit': 'mm', 'description': 'Daily precipitation'},
-        'uncomfortable': {'value': 'Variable', 'unit': 'Heat Index', 'description': 'Based on temperature and humidity'},
-        'poor_air': {'value': 'AQI > 100', 'unit': 'AQI', 'description': 'Air Quality Index'}
-    }
-    
-    return thresholds.get(condition, {'value': 'N/A', 'unit': '', 'description': 'Threshold not defined'})
+    return CONDITION_THRESHOLDS.get(condition, UNDEFINED_THRESHOLD)
+
+# Simulated historical frequency range (%) per condition; in a real
+# implementation this would come from historical NASA data
+HISTORICAL_FREQUENCY_RANGES = {
+    'very_hot': (15, 35),
+    'very_cold': (10, 25),
+    'very_windy': (20, 40),
+    'very_wet': (25, 45),
+    'uncomfortable': (30, 50),
+    'poor_air': (15, 30)
+}
 
 def get_historical_frequency(condition, lat, lon):
     """Get historical frequency of condition based on location."""
-    import random
-    
-    # Simulate historical frequency (in a real implementation, this would query historical NASA data)
-    base_frequencies = {
-        'very_hot': random.uniform(15, 35),
-        'very_cold': random.uniform(10, 25),
-        'very_windy': random.uniform(20, 40),
-        'very_wet': random.uniform(25, 45),
-        'uncomfortable': random.uniform(30, 50),
-        'poor_air': random.uniform(15, 30)
-    }
-    
-    return round(base_frequencies.get(condition, 25), 1)
+    bounds = HISTORICAL_FREQUENCY_RANGES.get(condition)
+    return round(random.uniform(*bounds), 1) if bounds else 25
 
 def generate_activity_recommendations(risk_analysis):
     """Generate activity recommendations based on risk analysis."""
@@ -1417,7 +1688,19 @@ def generate_activity_recommendations(risk_analysis):
     
     return recommendations
 
-@api_bp.route('/weather-forecast')
+def _hourly_condition(hour):
+    if hour < 6 or hour > 20:
+        return 'moon', 'Clear Night'
+    if hour < 10:
+        return 'sunrise', 'Morning'
+    if hour < 16:
+        return 'sun', 'Sunny'
+    return 'sunset', 'Evening'
+
+# (icon, condition) for each hour of the day, indexed by hour
+HOURLY_CONDITIONS = tuple(_hourly_condition(hour) for hour in range(24))
+
+@api_bp.route('/weather-forecast', methods=['GET'], strict_slashes=False)
 def get_weather_forecast():
     """
     Get weather forecast data for the dashboard.
@@ -1435,7 +1718,7 @@ def get_weather_forecast():
         lng = request.args.get('lng', type=float)
         days = request.args.get('days', 1, type=int)
         
-        if not lat or not lng:
+        if lat is None or lng is None:
             return jsonify({
                 'success': False,
                 'error': 'Latitude and longitude are required'
@@ -1447,18 +1730,7 @@ def get_weather_forecast():
         
         for i in range(12):  # 12 hours of forecast
             forecast_hour = (current_hour + i) % 24
-            if forecast_hour < 6 or forecast_hour > 20:
-                icon = 'moon'
-                condition = 'Clear Night'
-            elif forecast_hour < 10:
-                icon = 'sunrise'
-                condition = 'Morning'
-            elif forecast_hour < 16:
-                icon = 'sun'
-                condition = 'Sunny'
-            else:
-                icon = 'sunset'
-                condition = 'Evening'
+            icon, condition = HOURLY_CONDITIONS[forecast_hour]
             
             time_str = f"{forecast_hour:02d}:00" if i > 0 else "Now"
             
@@ -1484,7 +1756,7 @@ def get_weather_forecast():
             'location': {'lat': lat, 'lng': lng},
             'hourly': hourly_forecast,
             'details': details,
-            'generated_at': datetime.now().isoformat()
+            'generated_at': iso_now()
         }
         
         return jsonify(forecast_data)
@@ -1496,7 +1768,7 @@ def get_weather_forecast():
             'error': 'Failed to retrieve weather forecast'
         }), 500
 
-@api_bp.route('/smart-risk-alerts', methods=['POST'])
+@api_bp.route('/smart-risk-alerts', methods=['POST'], strict_slashes=False)
 def get_smart_risk_alerts():
     """
     Get smart risk alerts based on user location and interests.
@@ -1580,7 +1852,7 @@ def get_smart_risk_alerts():
             'success': True,
             'alerts': alerts,
             'location': location_name,
-            'generated_at': datetime.now().isoformat()
+            'generated_at': iso_now()
         })
         
     except Exception as e:
@@ -1590,7 +1862,7 @@ def get_smart_risk_alerts():
             'error': 'Failed to generate smart alerts'
         }), 500
 
-@api_bp.route('/weather-insights')
+@api_bp.route('/weather-insights', methods=['GET'], strict_slashes=False)
 def get_weather_insights():
     """
     Get AI-powered weather insights for the dashboard.
@@ -1603,8 +1875,8 @@ def get_weather_insights():
     - JSON with weather insights and analytics
     """
     try:
-        lat = request.args.get('lat', type=float) or 40.7128  # Default to NYC
-        lng = request.args.get('lng', type=float) or -74.0060
+        lat = request.args.get('lat', 40.7128, type=float)  # Default to NYC
+        lng = request.args.get('lng', -74.0060, type=float)
         
         # Generate AI-powered insights
         weather_score = random.randint(60, 95)
@@ -1641,7 +1913,7 @@ def get_weather_insights():
             'success': True,
             'insights': insights,
             'location': {'lat': lat, 'lng': lng},
-            'generated_at': datetime.utcnow().isoformat() + 'Z'
+            'generated_at': iso_now()
         })
         
     except Exception as e:
@@ -1651,7 +1923,7 @@ def get_weather_insights():
             'error': 'Failed to generate weather insights'
         }), 500
 
-@api_bp.route('/forecast', methods=['GET'])
+@api_bp.route('/forecast', methods=['GET'], strict_slashes=False)
 def get_forecast():
     """Get weather forecast data"""
     try:
@@ -1694,7 +1966,7 @@ def get_forecast():
                 'condition': random.choice(['sunny', 'cloudy', 'partly-cloudy'])
             },
             'hourly': hourly_forecast[:4],  # First 4 hours for display
-            'timestamp': datetime.utcnow().isoformat() + 'Z'
+            'timestamp': iso_now()
         })
         
     except Exception as e:
@@ -1704,7 +1976,7 @@ def get_forecast():
             'error': 'Failed to fetch forecast data'
         }), 500
 
-@api_bp.route('/activity-recommendations', methods=['GET'])
+@api_bp.route('/activity-recommendations', methods=['GET'], strict_slashes=False)
 def get_activity_recommendations():
     """Get activity recommendations based on weather"""
     try:
@@ -1755,7 +2027,7 @@ def get_activity_recommendations():
                 'wind_speed': round(wind_speed, 1),
                 'precipitation': round(precipitation, 1)
             },
-            'timestamp': datetime.utcnow().isoformat() + 'Z'
+            'timestamp': iso_now()
         })
         
     except Exception as e:
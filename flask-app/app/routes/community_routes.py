@@ -1,6 +1,7 @@
 from flask import Blueprint, request, jsonify, session
 from app.routes.auth_routes import login_required, get_current_user
 from app.services.community_service import CommunityService
+from app.utils.helpers import cached_response
 from app.models.community import Community, CommunityPost
 from app import db
 import logging
@@ -22,13 +23,14 @@
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 
 def allowed_file(filename):
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+    _, dot, extension = filename.rpartition('.')
+    return bool(dot) and extension.lower() in ALLOWED_EXTENSIONS
 
 def save_uploaded_file(file):
     """Save uploaded file and return the file path"""
     if file and allowed_file(file.filename):
         # Generate unique filename
-        file_extension = file.filename.rsplit('.', 1)[1].lower()
+        file_extension = file.filename.rpartition('.')[2].lower()
         unique_filename = f"{uuid.uuid4().hex}.{file_extension}"
         file_path = os.path.join(UPLOAD_FOLDER, unique_filename)
         
@@ -406,10 +408,14 @@ def search_communities():
 
 @community_bp.route('/stats')
 @login_required
+@cached_response(timeout=60)
 def get_stats():
     """Get community statistics"""
     try:
         stats = CommunityService.get_community_stats()
+        if stats is None:
+            # A non-200 keeps cached_response from storing the failure
+            return jsonify({'success': False, 'message': 'Failed to load stats'}), 500
         
         return jsonify({
             'success': True,
@@ -1,6 +1,7 @@
-from flask import Blueprint, render_template, jsonify, request, redirect, url_for, session
+from flask import Blueprint, render_template, jsonify, request, redirect, url_for, session, Response
 from app.routes.auth_routes import login_required, is_authenticated, get_current_user
 import logging
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -92,15 +93,18 @@ def missions_page():
 #     """About page - disabled, no template exists"""
 #     return render_template('about.html')
 
+# The health payload never changes, so serialize it once at import
+_HEALTH_BODY = orjson.dumps({
+    'status': 'healthy',
+    'service': 'TerraPulse',
+    'version': '1.0.0',
+    'description': 'Environmental Intelligence for Bangladesh'
+}) + b'\n'
+
 @main_bp.route('/health')
 def health_check():
     """Health check endpoint for TerraPulse"""
-    return jsonify({
-        'status': 'healthy',
-        'service': 'TerraPulse',
-        'version': '1.0.0',
-        'description': 'Environmental Intelligence for Bangladesh'
-    })
+    return Response(_HEALTH_BODY, mimetype='application/json')
 
 
 # API Routes for Profile Management
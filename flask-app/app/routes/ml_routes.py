@@ -8,6 +8,7 @@
 from app.services.ml.precipitation_predictor import precipitation_model
 from app.services.ml.weather_analytics import weather_analytics
 from app.services.ml.data_processor import data_processor, LocationData
+from app.utils.helpers import iso_now
 from datetime import datetime, timedelta
 import logging
 
@@ -293,7 +294,7 @@ def extract_weather_features():
             'feature_count': len(feature_dict),
             'observation_count': len(observations),
             'location': location_data,
-            'timestamp': datetime.utcnow().isoformat() + 'Z'
+            'timestamp': iso_now()
         })
         
     except Exception as e:
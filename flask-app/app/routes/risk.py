@@ -79,11 +79,10 @@ def get_risk_alerts():
                 'example': '/api/risk-alerts?lat=23.7644&lon=90.3897&crop=rice&start=20240925&end=20241001'
             }), 400
         
-        # Convert coordinates to float
-        try:
-            lat = float(lat)
-            lon = float(lon)
-        except ValueError:
+        # Re-read the coordinates as floats; Werkzeug yields None if one fails to parse
+        lat = request.args.get('lat', type=float)
+        lon = request.args.get('lon', type=float)
+        if lat is None or lon is None:
             return jsonify({
                 'success': False,
                 'error': 'Invalid coordinate values. Latitude and longitude must be numeric.',
@@ -1,7 +1,6 @@
 from app import db
 from app.models.user import User, UserSession, OnboardingProgress
 from flask import session, request
-from werkzeug.security import generate_password_hash
 from datetime import datetime, timedelta, timezone
 import secrets
 import uuid
@@ -254,6 +253,7 @@ def authenticate_user(email_or_username, password):
             
             # Update last login
             user.update_last_login()
+            db.session.commit()
             
             return {
                 'success': True,
@@ -304,20 +304,20 @@ def create_session(user_id, expires_hours=24):
     def get_session(session_id):
         """Get active session by session ID"""
         try:
-            user_session = UserSession.query.filter_by(
-                session_id=session_id,
-                is_active=True
+            # Expired sessions are filtered out in SQL and left for
+            # cleanup_expired_sessions() to deactivate
+            now = datetime.now(timezone.utc)
+            user_session = UserSession.query.filter(
+                UserSession.session_id == session_id,
+                UserSession.is_active == True,
+                UserSession.expires_at > now
             ).first()
             
             if not user_session:
-                return {'success': False, 'message': 'Session not found'}
-            
-            if user_session.is_expired():
-                user_session.deactivate()
-                return {'success': False, 'message': 'Session expired'}
+                return {'success': False, 'message': 'Session not found or expired'}
             
             # Update last activity
-            user_session.last_activity = datetime.now(timezone.utc)
+            user_session.last_activity = now
             db.session.commit()
             
             return {
@@ -337,6 +337,7 @@ def logout_session(session_id):
             
             if user_session:
                 user_session.deactivate()
+                db.session.commit()
                 return {'success': True, 'message': 'Logged out successfully'}
             
             return {'success': False, 'message': 'Session not found'}
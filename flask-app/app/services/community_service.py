@@ -3,10 +3,23 @@
 from app.models.user import User
 from datetime import datetime, timezone
 from sqlalchemy import desc, and_, or_
+from sqlalchemy.orm import load_only
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Columns read by CommunityPost.to_list_dict; the feed skips the rest
+# (tags, public post_id, moderation flags, share count, updated_at)
+_FEED_COLUMNS = load_only(
+    CommunityPost.id, CommunityPost.community_id, CommunityPost.user_id,
+    CommunityPost.post_type, CommunityPost.title, CommunityPost.content,
+    CommunityPost.location, CommunityPost.is_pinned,
+    CommunityPost.likes_count, CommunityPost.comments_count, CommunityPost.created_at,
+    CommunityPost.author_username, CommunityPost.author_full_name, CommunityPost.author_profile_type,
+    *(getattr(CommunityPost, field)
+      for fields in CommunityPost.TYPE_FIELDS.values() for field in fields)
+)
+
 
 class CommunityService:
     """Service class for community operations"""
@@ -23,7 +36,7 @@ def get_user_communities(user_id, limit=10, offset=0):
                 )
             ).order_by(desc(CommunityMember.joined_at)).limit(limit).offset(offset).all()
             
-            return [community.to_dict(include_user_info=user_id) for community in communities]
+            return Community.to_dicts(communities, user_id)
         except Exception as e:
             logger.error(f"Error getting user communities: {str(e)}")
             return []
@@ -72,7 +85,7 @@ def get_suggested_communities(user_id, limit=5):
             
             communities = query.order_by(desc(Community.member_count)).limit(limit).all()
             
-            return [community.to_dict(include_user_info=user_id) for community in communities]
+            return Community.to_dicts(communities, user_id)
         except Exception as e:
             logger.error(f"Error getting suggested communities: {str(e)}")
             return []
@@ -111,9 +124,6 @@ def join_community(user_id, community_id):
             
             db.session.commit()
             
-            # Update community stats
-            community.update_stats()
-            
             return {'success': True, 'message': 'Successfully joined community'}
         except Exception as e:
             logger.error(f"Error joining community: {str(e)}")
@@ -141,10 +151,6 @@ def leave_community(user_id, community_id):
             member.is_active = False
             db.session.commit()
             
-            # Update community stats
-            if community:
-                community.update_stats()
-            
             return {'success': True, 'message': 'Successfully left community'}
         except Exception as e:
             logger.error(f"Error leaving community: {str(e)}")
@@ -181,12 +187,12 @@ def get_community_feed(user_id, community_id=None, post_type=None, limit=20, off
                 query = query.filter(CommunityPost.post_type == post_type)
             
             # Order by pinned first, then by creation date
-            posts = query.order_by(
+            posts = query.options(_FEED_COLUMNS).order_by(
                 desc(CommunityPost.is_pinned),
                 desc(CommunityPost.created_at)
             ).limit(limit).offset(offset).all()
             
-            return [post.to_dict(include_user_info=user_id) for post in posts]
+            return CommunityPost.to_dicts(posts, user_id, list_view=True)
         except Exception as e:
             logger.error(f"Error getting community feed: {str(e)}")
             return []
@@ -196,14 +202,7 @@ def create_post(user_id, community_id, content, post_type='text', **kwargs):
         """Create a new community post"""
         try:
             # Check if user is a member of the community
-            member = CommunityMember.query.filter_by(
-                community_id=community_id,
-                user_id=user_id,
-                is_active=True,
-                is_approved=True
-            ).first()
-            
-            if not member:
+            if not CommunityMember.can_participate(community_id, user_id):
                 return {'success': False, 'message': 'You must be a member to post'}
             
             # Create post
@@ -218,11 +217,6 @@ def create_post(user_id, community_id, content, post_type='text', **kwargs):
             db.session.add(post)
             db.session.commit()
             
-            # Update community stats
-            community = Community.query.get(community_id)
-            if community:
-                community.update_stats()
-            
             return {
                 'success': True, 
                 'message': 'Post created successfully',
@@ -258,9 +252,6 @@ def like_post(user_id, post_id):
             
             db.session.commit()
             
-            # Update post stats
-            post.update_engagement_stats()
-            
             return {
                 'success': True, 
                 'message': f'Post {action}',
@@ -281,14 +272,7 @@ def add_comment(user_id, post_id, content, parent_id=None):
                 return {'success': False, 'message': 'Post not found'}
             
             # Check if user is a member of the community
-            member = CommunityMember.query.filter_by(
-                community_id=post.community_id,
-                user_id=user_id,
-                is_active=True,
-                is_approved=True
-            ).first()
-            
-            if not member:
+            if not CommunityMember.can_participate(post.community_id, user_id):
                 return {'success': False, 'message': 'You must be a member to comment'}
             
             comment = PostComment(
@@ -301,9 +285,6 @@ def add_comment(user_id, post_id, content, parent_id=None):
             db.session.add(comment)
             db.session.commit()
             
-            # Update post stats
-            post.update_engagement_stats()
-            
             return {
                 'success': True, 
                 'message': 'Comment added successfully',
@@ -331,7 +312,7 @@ def get_post_comments(post_id, limit=20, offset=0):
     
     @staticmethod
     def get_community_stats():
-        """Get overall community statistics"""
+        """Get overall community statistics, or None if they could not be read"""
         try:
             total_communities = Community.query.filter_by(is_active=True).count()
             total_members = CommunityMember.query.filter_by(is_active=True).count()
@@ -351,12 +332,7 @@ def get_community_stats():
             }
         except Exception as e:
             logger.error(f"Error getting community stats: {str(e)}")
-            return {
-                'total_communities': 0,
-                'total_members': 0,
-                'total_posts': 0,
-                'popular_communities': []
-            }
+            return None
     
     @staticmethod
     def search_communities(query, user_id, limit=10):
@@ -374,7 +350,7 @@ def search_communities(query, user_id, limit=10):
                 )
             ).order_by(desc(Community.member_count)).limit(limit).all()
             
-            return [community.to_dict(include_user_info=user_id) for community in communities]
+            return Community.to_dicts(communities, user_id)
         except Exception as e:
             logger.error(f"Error searching communities: {str(e)}")
             return []
@@ -404,9 +380,6 @@ def create_community(user_id, name, description, category='general', **kwargs):
             db.session.add(member)
             db.session.commit()
             
-            # Update stats
-            community.update_stats()
-            
             return {
                 'success': True,
                 'message': 'Community created successfully',
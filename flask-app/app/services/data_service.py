@@ -1,5 +1,5 @@
 from app import db
-from app.models import DataRecord, data_record_schema, data_records_schema
+from app.models import DataRecord, data_record_schema, data_record_summaries_schema
 from datetime import datetime
 import json
 
@@ -17,7 +17,7 @@ def get_all_data_records(page=1, per_page=50):
             )
             
             result = {
-                'data': data_records_schema.dump(pagination.items),
+                'data': data_record_summaries_schema.dump(pagination.items),
                 'pagination': {
                     'page': pagination.page,
                     'per_page': pagination.per_page,
@@ -42,7 +42,7 @@ def get_data_by_mission(mission_id, page=1, per_page=50):
             )
             
             result = {
-                'data': data_records_schema.dump(pagination.items),
+                'data': data_record_summaries_schema.dump(pagination.items),
                 'pagination': {
                     'page': pagination.page,
                     'per_page': pagination.per_page,
@@ -93,7 +93,7 @@ def get_data_by_type(record_type, page=1, per_page=50):
             )
             
             result = {
-                'data': data_records_schema.dump(pagination.items),
+                'data': data_record_summaries_schema.dump(pagination.items),
                 'pagination': {
                     'page': pagination.page,
                     'per_page': pagination.per_page,
@@ -111,17 +111,22 @@ def get_data_by_type(record_type, page=1, per_page=50):
     def get_data_by_location(lat_min, lat_max, lon_min, lon_max, page=1, per_page=50):
         """Get data records by geographic bounds"""
         try:
-            pagination = DataRecord.query.filter(
-                DataRecord.latitude.between(lat_min, lat_max),
-                DataRecord.longitude.between(lon_min, lon_max)
-            ).paginate(
+            if lat_min <= -90 and lat_max >= 90 and lon_min <= -180 and lon_max >= 180:
+                # The box covers the whole globe; only rows without a position fall outside
+                location_filter = (DataRecord.latitude.isnot(None), DataRecord.longitude.isnot(None))
+            else:
+                location_filter = (
+                    DataRecord.latitude.between(lat_min, lat_max),
+                    DataRecord.longitude.between(lon_min, lon_max)
+                )
+            pagination = DataRecord.query.filter(*location_filter).paginate(
                 page=page, 
                 per_page=per_page, 
                 error_out=False
             )
             
             result = {
-                'data': data_records_schema.dump(pagination.items),
+                'data': data_record_summaries_schema.dump(pagination.items),
                 'pagination': {
                     'page': pagination.page,
                     'per_page': pagination.per_page,
@@ -16,6 +16,7 @@
 
 import os
 import requests
+from app.services.http_client import pooled_session
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
@@ -30,7 +31,7 @@ def __init__(self):
         self.base_url = "https://gpm1.gesdisc.eosdis.nasa.gov/data/GPM_L3"
         self.earthdata_user = os.getenv('EARTHDATA_USER')
         self.earthdata_pass = os.getenv('EARTHDATA_PASS')
-        self.session = requests.Session()
+        self.session = pooled_session()
         
         # Set up authentication if credentials are available
         if self.earthdata_user and self.earthdata_pass:
@@ -0,0 +1,32 @@
+"""
+Shared HTTP client for upstream NASA APIs
+
+Every service that talks to NASA without credentials goes through SESSION,
+so keep-alive connections and TLS sessions are reused across services and
+requests. Services that attach credentials build their own pooled session
+so those credentials are never sent to other hosts.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Matches the gthread thread count so each worker thread can hold a connection
+HTTP_POOL_SIZE = 32
+
+def pooled_session(pool_size=HTTP_POOL_SIZE):
+    """Return a requests.Session with a keep-alive pool and brief retries"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size * 2,
+        # Retry failed connects and 502/503/504 on idempotent methods; never
+        # read timeouts, which would stack the 30s service timeouts
+        max_retries=Retry(total=2, read=0, backoff_factor=0.2,
+                          status_forcelist=(502, 503, 504), raise_on_status=False)
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+SESSION = pooled_session()
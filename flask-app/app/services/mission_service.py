@@ -1,17 +1,23 @@
 from app import db
-from app.models import Mission, mission_schema, missions_schema
+from app.models import Mission
 from sqlalchemy.exc import IntegrityError
 from datetime import datetime
 
 class MissionService:
     """Service layer for Mission operations"""
     
+    @staticmethod
+    def _select_mission_rows(*criteria):
+        """Fetch mission columns as plain dicts, bypassing the ORM identity map"""
+        stmt = db.select(*Mission.__table__.columns).where(*criteria).order_by(Mission.id)
+        return [dict(row) for row in db.session.execute(stmt).mappings()]
+    
     @staticmethod
     def get_all_missions():
         """Get all missions"""
         try:
-            missions = Mission.query.all()
-            return missions_schema.dump(missions), None
+            missions = MissionService._select_mission_rows()
+            return missions, None
         except Exception as e:
             return None, str(e)
     
@@ -21,7 +27,7 @@ def get_mission_by_id(mission_id):
         try:
             mission = Mission.query.get(mission_id)
             if mission:
-                return mission_schema.dump(mission), None
+                return mission.to_dict(), None
             return None, "Mission not found"
         except Exception as e:
             return None, str(e)
@@ -42,7 +48,7 @@ def create_mission(mission_data):
             db.session.add(mission)
             db.session.commit()
             
-            return mission_schema.dump(mission), None
+            return mission.to_dict(), None
         except IntegrityError:
             db.session.rollback()
             return None, "Mission with this name already exists"
@@ -75,7 +81,7 @@ def update_mission(mission_id, mission_data):
             mission.updated_at = datetime.utcnow()
             db.session.commit()
             
-            return mission_schema.dump(mission), None
+            return mission.to_dict(), None
         except IntegrityError:
             db.session.rollback()
             return None, "Mission with this name already exists"
@@ -103,8 +109,8 @@ def delete_mission(mission_id):
     def get_missions_by_type(mission_type):
         """Get missions by type"""
         try:
-            missions = Mission.query.filter_by(mission_type=mission_type).all()
-            return missions_schema.dump(missions), None
+            missions = MissionService._select_mission_rows(Mission.mission_type == mission_type)
+            return missions, None
         except Exception as e:
             return None, str(e)
     
@@ -112,7 +118,7 @@ def get_missions_by_type(mission_type):
     def get_missions_by_status(status):
         """Get missions by status"""
         try:
-            missions = Mission.query.filter_by(status=status).all()
-            return missions_schema.dump(missions), None
+            missions = MissionService._select_mission_rows(Mission.status == status)
+            return missions, None
         except Exception as e:
             return None, str(e)
\ No newline at end of file
@@ -75,11 +75,13 @@ def _train_demo_models(self):
         """Train models with synthetic demo data"""
         try:
             # Generate synthetic weather data for training
-            np.random.seed(42)
+            # Local generator: same data as seeding the global one with 42,
+            # without resetting np.random for the rest of the process
+            rng = np.random.RandomState(42)
             n_samples = 1000
             
             # Features: temperature, humidity, pressure, wind_speed, cloud_cover
-            X = np.random.rand(n_samples, 5)
+            X = rng.rand(n_samples, 5)
             X[:, 0] = X[:, 0] * 40 + 10  # Temperature 10-50°C
             X[:, 1] = X[:, 1] * 100      # Humidity 0-100%
             X[:, 2] = X[:, 2] * 50 + 980 # Pressure 980-1030 hPa
@@ -87,7 +89,7 @@ def _train_demo_models(self):
             X[:, 4] = X[:, 4] * 100      # Cloud cover 0-100%
             
             # Target: precipitation (correlated with humidity and cloud cover)
-            y_rainfall = (X[:, 1] * 0.05 + X[:, 4] * 0.03 + np.random.normal(0, 1, n_samples)) * 2
+            y_rainfall = (X[:, 1] * 0.05 + X[:, 4] * 0.03 + rng.normal(0, 1, n_samples)) * 2
             y_rainfall = np.clip(y_rainfall, 0, 50)  # 0-50mm/day
             
             # Intensity classification (0=None, 1=Light, 2=Moderate, 3=Heavy, 4=Very Heavy)
@@ -17,7 +17,7 @@
 """
 
 import os
-import requests
+from app.services.http_client import SESSION
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
@@ -32,7 +32,7 @@ class MODISAirQualityService:
     def __init__(self):
         self.laads_base_url = "https://ladsweb.modaps.eosdis.nasa.gov/api/v2"
         self.giovanni_base_url = "https://giovanni.gsfc.nasa.gov/giovanni"
-        self.session = requests.Session()
+        self.session = SESSION
         
         # Future: Add authentication for actual MODIS data access
         # self.earthdata_token = os.getenv('EARTHDATA_TOKEN')
@@ -6,8 +6,11 @@
 
 import requests
 import logging
+import orjson
+from app.services.http_client import SESSION
 from datetime import datetime
 from typing import Dict, List, Optional, Union
+from urllib.parse import urlencode
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +19,9 @@ class PowerAPIService:
     
     BASE_URL = "https://power.larc.nasa.gov/api/temporal/daily/point"
     
+    # Shared across calls so NASA connections stay alive between requests
+    session = SESSION
+    
     @staticmethod
     def get_power_data(lat: float, lon: float, start: str, end: str, 
                       parameters: Optional[str] = None) -> Dict[str, Union[List, str, bool]]:
@@ -69,16 +75,25 @@ def get_power_data(lat: float, lon: float, start: str, end: str,
                 parameters = 'T2M,PRECTOT'  # Temperature at 2m, Precipitation
             
             # Build API URL
-            url = f"{PowerAPIService.BASE_URL}?parameters={parameters}&community=AG&longitude={lon}&latitude={lat}&start={start}&end={end}&format=JSON"
+            query = urlencode({
+                'parameters': parameters,
+                'community': 'AG',
+                'longitude': lon,
+                'latitude': lat,
+                'start': start,
+                'end': end,
+                'format': 'JSON'
+            }, safe=',')
+            url = f"{PowerAPIService.BASE_URL}?{query}"
             
             logger.info(f"Requesting NASA POWER data for lat={lat}, lon={lon}, start={start}, end={end}")
             
             # Make API request with timeout
-            response = requests.get(url, timeout=30)
+            response = PowerAPIService.session.get(url, timeout=30)
             response.raise_for_status()
             
-            # Parse JSON response
-            data = response.json()
+            # Parse JSON response (orjson; decode errors are ValueErrors too)
+            data = orjson.loads(response.content)
             
             # Process the data into a mobile-friendly format
             processed_data = PowerAPIService._process_api_response(data)
@@ -17,12 +17,16 @@
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 import statistics
 
 logger = logging.getLogger(__name__)
 
+# Shared pool for fanning out the independent upstream NASA fetches
+_fetch_pool = ThreadPoolExecutor(max_workers=16, thread_name_prefix='risk-fetch')
+
 class RiskEngine:
     """Agricultural Risk Analysis Engine"""
     
@@ -112,11 +116,15 @@ def crop_risk_analysis(
             # Get crop profile
             crop_profile = self.crop_profiles.get(crop.lower(), self.crop_profiles["rice"])
             
-            # Fetch data from all sources
-            weather_data = self._fetch_weather_data(lat, lon, start, end)
-            precipitation_data = self._fetch_precipitation_data(lat, lon, start, end)
-            vegetation_data = self._fetch_vegetation_data(lat, lon, start, end)
+            # Fetch data from all sources; the NASA calls are independent
+            # and I/O-bound, so run them concurrently
+            weather_future = _fetch_pool.submit(self._fetch_weather_data, lat, lon, start, end)
+            precipitation_future = _fetch_pool.submit(self._fetch_precipitation_data, lat, lon, start, end)
+            vegetation_future = _fetch_pool.submit(self._fetch_vegetation_data, lat, lon, start, end)
             historical_data = self._fetch_historical_data(lat, lon, crop)
+            weather_data = weather_future.result()
+            precipitation_data = precipitation_future.result()
+            vegetation_data = vegetation_future.result()
             
             # Analyze risks
             alerts = []
@@ -207,8 +215,7 @@ def _fetch_weather_data(self, lat: float, lon: float, start: str, end: str) -> D
         """Fetch weather data from NASA POWER API"""
         try:
             from app.services.power_api import PowerAPIService
-            power_service = PowerAPIService()
-            result = power_service.get_power_data(lat, lon, start, end, "T2M,T2M_MAX,T2M_MIN,PRECTOTCORR")
+            result = PowerAPIService.get_power_data(lat, lon, start, end, "T2M,T2M_MAX,T2M_MIN,PRECTOTCORR")
             logger.info(f"Weather data fetch: {'success' if result.get('success') else 'failed'}")
             return result
         except Exception as e:
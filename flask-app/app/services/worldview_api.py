@@ -9,6 +9,7 @@
 """
 
 import requests
+from app.services.http_client import SESSION
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, Optional, Tuple
@@ -24,6 +25,7 @@ def __init__(self):
         self.default_width = 1024
         self.default_height = 1024
         self.default_format = "png"
+        self.session = SESSION
         logger.info("NASA Worldview Service initialized")
     
     def get_worldview_image(
@@ -94,7 +96,7 @@ def get_worldview_image(
             logger.info(f"NASA Worldview API request: lat={lat}, lon={lon}, date={date}, layers={layers}")
             
             # Make the API request
-            response = requests.get(self.base_url, params=params, timeout=30)
+            response = self.session.get(self.base_url, params=params, timeout=30)
             
             if response.status_code == 200:
                 # For successful requests, the API returns the image directly
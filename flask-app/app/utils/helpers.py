@@ -1,6 +1,153 @@
+from concurrent.futures import Future
+from datetime import datetime, timezone
 from functools import wraps
-from flask import request, jsonify
+from flask import request, jsonify, make_response, Response
+from flask.json.provider import DefaultJSONProvider
+import orjson
 import re
+import threading
+import time
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson
+
+    Datetimes, dates, UUIDs and numpy values are encoded natively in C, so
+    model to_dict() output can carry them as-is. Anything orjson does not
+    know falls back to Flask's default handling (Decimal, __html__, ...).
+    """
+
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def _dumps_bytes(self, obj, indent=False):
+        option = self.option
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option)
+
+    def dumps(self, obj, **kwargs):
+        return self._dumps_bytes(obj, indent=kwargs.get('indent')).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        return self._app.response_class(
+            self._dumps_bytes(obj, indent=indent) + b'\n',
+            mimetype=self.mimetype
+        )
+
+# cache key -> (fresh_until, stale_until, body, mimetype) for cached_response
+_response_cache = {}
+_response_cache_lock = threading.Lock()
+RESPONSE_CACHE_MAX_ENTRIES = 1024
+# How long an expired entry may still be served when the handler fails
+RESPONSE_CACHE_STALE_GRACE = 86400
+
+def cached_response(timeout=3600):
+    """Cache a GET handler's successful responses in-process
+
+    Entries are keyed on the endpoint plus its query arguments in sorted
+    order, so argument order does not split the cache. ``timeout`` is either
+    seconds or a callable returning seconds for the current request. Only 200
+    responses are stored. If a later refresh fails, the expired copy is served
+    for up to RESPONSE_CACHE_STALE_GRACE seconds rather than the error.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            key = (request.endpoint, tuple(sorted(request.args.items(multi=True))))
+            entry = _response_cache.get(key)
+            now = time.monotonic()
+            if entry is not None and entry[0] > now:
+                return Response(entry[2], mimetype=entry[3])
+
+            response = make_response(f(*args, **kwargs))
+            if response.status_code == 200 and not response.is_streamed:
+                fresh_until = now + (timeout() if callable(timeout) else timeout)
+                stored = (fresh_until, fresh_until + RESPONSE_CACHE_STALE_GRACE,
+                          response.get_data(), response.mimetype)
+                with _response_cache_lock:
+                    if len(_response_cache) >= RESPONSE_CACHE_MAX_ENTRIES:
+                        # Drop the oldest insertion to keep memory bounded
+                        _response_cache.pop(next(iter(_response_cache)), None)
+                    _response_cache[key] = stored
+            elif entry is not None and entry[1] > now:
+                return Response(entry[2], mimetype=entry[3])
+            return response
+        return decorated_function
+    return decorator
+
+# Calls currently running in coalesce_calls, keyed by their arguments
+_in_flight = {}
+_in_flight_lock = threading.Lock()
+IN_FLIGHT_WAIT_TIMEOUT = 60
+
+def coalesce_calls(key, fn, *args):
+    """Run fn(*args) once for all concurrent callers sharing the same key
+
+    The first caller runs the call on its own thread and publishes the result
+    through a Future; callers arriving while it is in flight wait on that
+    Future instead of firing a duplicate upstream request.
+    """
+    with _in_flight_lock:
+        future = _in_flight.get(key)
+        owner = future is None
+        if owner:
+            future = _in_flight[key] = Future()
+
+    if not owner:
+        return future.result(timeout=IN_FLIGHT_WAIT_TIMEOUT)
+
+    try:
+        result = fn(*args)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _in_flight_lock:
+            _in_flight.pop(key, None)
+
+STREAM_CHUNK_RECORDS = 256
+
+def stream_json(payload, key='data'):
+    """Yield payload as JSON bytes, encoding payload[key] in record chunks
+
+    The list under ``key`` is written first and encoded STREAM_CHUNK_RECORDS
+    at a time, so the whole body never has to exist in memory at once.
+    """
+    option = OrjsonProvider.option
+    records = payload[key]
+    yield b'{' + orjson.dumps(key) + b':['
+    for offset in range(0, len(records), STREAM_CHUNK_RECORDS):
+        chunk = orjson.dumps(records[offset:offset + STREAM_CHUNK_RECORDS], option=option)
+        yield (b',' if offset else b'') + chunk[1:-1]
+    rest = orjson.dumps({k: v for k, v in payload.items() if k != key}, option=option)
+    yield b']' + (b',' + rest[1:] if len(rest) > 2 else b'}')
+
+# (epoch second, formatted string); replaced as a whole so readers never see
+# one second's number paired with another's string
+_iso_now_cache = (0, '')
+
+def iso_now():
+    """Current UTC time as ISO 8601 with a Z suffix, to the second
+
+    Formatted at most once per second; requests in the same second share it.
+    """
+    global _iso_now_cache
+    second = int(time.time())
+    cached = _iso_now_cache
+    if cached[0] != second:
+        cached = _iso_now_cache = (
+            second, datetime.fromtimestamp(second, timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+        )
+    return cached[1]
 
 def validate_json(f):
     """Decorator to validate JSON request data"""
@@ -0,0 +1,57 @@
+"""
+Gunicorn configuration for the NASA Space App
+
+Usage:
+    gunicorn -c gunicorn.conf.py 'app:create_app()'
+
+Nearly every API request spends its time waiting on an upstream NASA service,
+so each worker runs a pool of threads to keep many of those calls in flight.
+"""
+
+import multiprocessing
+import os
+import threading
+
+bind = f"{os.getenv('FLASK_HOST', '0.0.0.0')}:{os.getenv('FLASK_PORT', '8081')}"
+
+workers = int(os.getenv('GUNICORN_WORKERS', multiprocessing.cpu_count()))
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', 32))
+
+# Upstream NASA requests time out after 30s; leave headroom above that
+timeout = 90
+keepalive = 75
+
+accesslog = '-'
+errorlog = '-'
+
+
+def _warm_upstream_connections():
+    """Resolve and connect to each live NASA host so first requests skip it"""
+    from urllib.parse import urlsplit
+
+    import requests
+
+    from app.services.gpm_api import gpm_service
+    from app.services.power_api import PowerAPIService
+    from app.services.worldview_api import worldview_service
+
+    targets = [
+        (PowerAPIService.session, PowerAPIService.BASE_URL),
+        (worldview_service.session, worldview_service.base_url)
+    ]
+    # GPM only goes upstream with Earthdata credentials; MODIS is mock-only
+    if gpm_service.session.auth:
+        targets.append((gpm_service.session, gpm_service.base_url))
+
+    for session, url in targets:
+        parts = urlsplit(url)
+        try:
+            session.head(f"{parts.scheme}://{parts.netloc}/", timeout=2)
+        except requests.RequestException:
+            pass
+
+
+def post_worker_init(worker):
+    # Off the boot path: a slow or unreachable host must not delay serving
+    threading.Thread(target=_warm_upstream_connections, name='warm-upstream', daemon=True).start()
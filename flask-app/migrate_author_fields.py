@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Migration script to add denormalized author columns to community_posts and post_comments.
+Adds: author_username, author_full_name, author_profile_type, backfilled from users
+"""
+from app import create_app, db
+import sqlalchemy as sa
+
+TABLES = ['community_posts', 'post_comments']
+
+COLUMNS = [
+    ("author_username", "VARCHAR(80) NOT NULL DEFAULT ''"),
+    ("author_full_name", "VARCHAR(100)"),
+    ("author_profile_type", "VARCHAR(20)"),
+]
+
+def migrate():
+    app = create_app()
+    app.app_context().push()
+    
+    for table in TABLES:
+        print(f"🔄 Adding author columns to {table} table...")
+        
+        for column_name, column_type in COLUMNS:
+            try:
+                db.session.execute(sa.text(f"ALTER TABLE {table} ADD COLUMN {column_name} {column_type}"))
+                db.session.commit()
+                print(f"  ✅ Added column: {column_name}")
+            except Exception as e:
+                db.session.rollback()
+                if 'duplicate column' in str(e).lower() or 'already exists' in str(e).lower():
+                    print(f"  ⏭️  Column already exists: {column_name}")
+                else:
+                    print(f"  ❌ Error: {e}")
+                    raise
+        
+        # Backfill every row from its author in one statement per column
+        for column_name, _ in COLUMNS:
+            source = column_name[len('author_'):]
+            db.session.execute(sa.text(
+                f"UPDATE {table} SET {column_name} = "
+                f"(SELECT users.{source} FROM users WHERE users.id = {table}.user_id)"
+            ))
+        db.session.commit()
+    
+    print("\n✅ Migration completed successfully!")
+
+if __name__ == '__main__':
+    migrate()
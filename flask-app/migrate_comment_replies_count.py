@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Migration script to add the replies_count column to post_comments.
+Adds: replies_count, backfilled from the active replies of each comment
+"""
+from app import create_app, db
+import sqlalchemy as sa
+
+def migrate():
+    app = create_app()
+    app.app_context().push()
+    
+    print("🔄 Adding replies_count column to post_comments table...")
+    
+    try:
+        db.session.execute(sa.text(
+            "ALTER TABLE post_comments ADD COLUMN replies_count INTEGER NOT NULL DEFAULT 0"
+        ))
+        print("  ✅ Added column: replies_count")
+    except Exception as e:
+        if 'duplicate column' in str(e).lower() or 'already exists' in str(e).lower():
+            db.session.rollback()
+            print("  ⏭️  Column already exists: replies_count")
+        else:
+            print(f"  ❌ Error: {e}")
+            raise
+    
+    # Backfill from the current active replies in one statement
+    db.session.execute(sa.text(
+        "UPDATE post_comments SET replies_count = ("
+        "SELECT COUNT(*) FROM post_comments AS replies "
+        "WHERE replies.parent_id = post_comments.id AND replies.is_active = :active)"
+    ), {'active': True})
+    
+    db.session.commit()
+    print("\n✅ Migration completed successfully!")
+
+if __name__ == '__main__':
+    migrate()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Migration script to convert public identifier columns to the native UUID type.
+Converts: users.user_id, communities.community_id, community_posts.post_id,
+post_comments.comment_id, post_attachments.attachment_id
+
+Only PostgreSQL stores a native uuid. Elsewhere (SQLite) the Uuid type
+stores 32-character hex, so existing dashed values are rewritten in place.
+"""
+from app import create_app, db
+import sqlalchemy as sa
+
+UUID_COLUMNS = [
+    ('users', 'user_id'),
+    ('communities', 'community_id'),
+    ('community_posts', 'post_id'),
+    ('post_comments', 'comment_id'),
+    ('post_attachments', 'attachment_id'),
+]
+
+def migrate():
+    app = create_app()
+    app.app_context().push()
+    
+    if db.engine.dialect.name != 'postgresql':
+        print("🔄 Rewriting dashed identifiers as 32-character hex...")
+        
+        for table, column in UUID_COLUMNS:
+            result = db.session.execute(sa.text(
+                f"UPDATE {table} SET {column} = replace({column}, '-', '') "
+                f"WHERE {column} LIKE '%-%'"
+            ))
+            print(f"  ✅ Rewrote {result.rowcount} rows in: {table}.{column}")
+        
+        db.session.commit()
+        print("\n✅ Migration completed successfully!")
+        return
+    
+    print("🔄 Converting identifier columns to uuid...")
+    
+    for table, column in UUID_COLUMNS:
+        db.session.execute(sa.text(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE uuid USING {column}::uuid"
+        ))
+        print(f"  ✅ Converted column: {table}.{column}")
+    
+    db.session.commit()
+    print("\n✅ Migration completed successfully!")
+
+if __name__ == '__main__':
+    migrate()
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Migration script to store community_posts.tags as JSONB with a GIN index.
+Converts: tags json -> jsonb; adds ix_community_posts_tags_gin
+
+Only PostgreSQL has JSONB; other databases keep the plain JSON column.
+"""
+from app import create_app, db
+import sqlalchemy as sa
+
+def migrate():
+    app = create_app()
+    app.app_context().push()
+    
+    if db.engine.dialect.name != 'postgresql':
+        print("⏭️  JSONB tags only apply to PostgreSQL; nothing to do")
+        return
+    
+    print("🔄 Converting community_posts.tags to jsonb...")
+    
+    db.session.execute(sa.text(
+        "ALTER TABLE community_posts ALTER COLUMN tags TYPE jsonb USING tags::jsonb"
+    ))
+    print("  ✅ Converted column: tags")
+    
+    db.session.execute(sa.text(
+        "CREATE INDEX IF NOT EXISTS ix_community_posts_tags_gin "
+        "ON community_posts USING gin (tags)"
+    ))
+    print("  ✅ Created index: ix_community_posts_tags_gin")
+    
+    db.session.commit()
+    print("\n✅ Migration completed successfully!")
+
+if __name__ == '__main__':
+    migrate()
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Migration script to add the cached profile_completion column to users table.
+Adds: profile_completion, backfilled from User.get_profile_completion()
+"""
+from app import create_app, db
+from app.models.user import User
+import sqlalchemy as sa
+
+def migrate():
+    app = create_app()
+    app.app_context().push()
+    
+    print("🔄 Adding profile_completion column to users table...")
+    
+    try:
+        db.session.execute(sa.text(
+            "ALTER TABLE users ADD COLUMN profile_completion INTEGER NOT NULL DEFAULT 0"
+        ))
+        db.session.commit()
+        print("  ✅ Added column: profile_completion")
+    except Exception as e:
+        db.session.rollback()
+        if 'duplicate column' in str(e).lower() or 'already exists' in str(e).lower():
+            print("  ⏭️  Column already exists: profile_completion")
+        else:
+            print(f"  ❌ Error: {e}")
+            raise
+    
+    # The value is derived in Python, so backfill through the model
+    for user in User.query.all():
+        user.profile_completion = user.get_profile_completion()
+    
+    db.session.commit()
+    print("\n✅ Migration completed successfully!")
+
+if __name__ == '__main__':
+    migrate()
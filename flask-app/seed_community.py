@@ -422,13 +422,10 @@ def main():
         member_users = random.sample([u for u in users if u.id != creator.id], 
                                    min(num_members, len(users) - 1))
         
-        for user in member_users:
-            member = CommunityMember(
-                community_id=community.id,
-                user_id=user.id,
-                role='member'
-            )
-            db.session.add(member)
+        CommunityMember.bulk_create([
+            {'community_id': community.id, 'user_id': user.id, 'role': 'member'}
+            for user in member_users
+        ])
         
         created_communities.append(community)
         print(f"Created community: {community.name} with {num_members + 1} members")
@@ -612,6 +609,7 @@ def create_sample_posts(communities):
     # Update community stats
     for community in communities:
         community.update_stats()
+    db.session.commit()
     
     return created_posts
 
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Test script for CommunityMember.bulk_create.
+
+This script inserts a batch of memberships whose rows carry different
+optional keys and checks the stored defaults and member_count.
+"""
+
+import sys
+import os
+import uuid
+
+# Add the app directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'app'))
+
+def test_bulk_create_mixed_rows():
+    """Rows that omit optional columns get defaults and still share one INSERT"""
+    print("👥 Testing CommunityMember.bulk_create")
+    print("=" * 40)
+
+    from app import create_app, db
+    from app.models.user import User
+    from app.models.community import Community, CommunityMember
+
+    app = create_app()
+
+    with app.app_context():
+        tag = uuid.uuid4().hex[:8]
+        users = [
+            User(email=f'bulk{tag}{i}@example.com', username=f'bulk{tag}{i}', password='secret123')
+            for i in range(4)
+        ]
+        db.session.add_all(users)
+        db.session.flush()
+
+        community = Community(name=f'Bulk Test {tag}', created_by=users[0].id)
+        db.session.add(community)
+        db.session.flush()
+
+        try:
+            CommunityMember.bulk_create([
+                {'community_id': community.id, 'user_id': users[0].id, 'role': 'admin'},
+                {'community_id': community.id, 'user_id': users[1].id, 'is_active': False},
+                {'community_id': community.id, 'user_id': users[2].id},
+                {'community_id': community.id, 'user_id': users[3].id, 'is_active': True},
+            ])
+            db.session.expire_all()
+
+            members = {m.user_id: m for m in CommunityMember.query.filter_by(community_id=community.id)}
+            print(f"   Inserted memberships: {len(members)}")
+            assert len(members) == 4
+            assert members[users[0].id].role == 'admin'
+            assert members[users[2].id].role == 'member'
+            assert members[users[1].id].is_active is False
+            assert all(m.is_approved and m.joined_at and m.updated_at for m in members.values())
+
+            refreshed = db.session.get(Community, community.id)
+            print(f"   member_count: {refreshed.member_count}")
+            assert refreshed.member_count == refreshed.get_member_count() == 3
+            print("   ✅ Defaults filled and member_count matches active rows")
+        finally:
+            db.session.rollback()
+
+if __name__ == "__main__":
+    test_bulk_create_mixed_rows()
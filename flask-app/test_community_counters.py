@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Test script for the community counter listeners.
+
+This script joins, leaves, likes and comments through CommunityService and
+checks each stored counter against a fresh recount.
+"""
+
+import sys
+import os
+import uuid
+
+# Add the app directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'app'))
+
+def test_counters_match_recount():
+    """Listener-maintained counters agree with update_stats()/update_engagement_stats()"""
+    print("🔢 Testing community counter listeners")
+    print("=" * 40)
+
+    from app import create_app, db
+    from app.models.user import User
+    from app.models.community import Community, CommunityPost, PostComment
+    from app.services.community_service import CommunityService
+
+    app = create_app()
+
+    with app.app_context():
+        tag = uuid.uuid4().hex[:8]
+        owner, member = users = [
+            User(email=f'count{tag}{i}@example.com', username=f'count{tag}{i}', password='secret123')
+            for i in range(2)
+        ]
+        db.session.add_all(users)
+        db.session.commit()
+
+        result = CommunityService.create_community(owner.id, f'Counter Test {tag}', 'Counter checks')
+        assert result['success'], result
+        community_id = result['community']['id']
+
+        def check_community(expected_members, expected_posts):
+            db.session.expire_all()
+            community = db.session.get(Community, community_id)
+            stored = (community.member_count, community.post_count)
+            community.update_stats()
+            recounted = (community.member_count, community.post_count)
+            db.session.rollback()
+            print(f"   members/posts stored {stored}, recounted {recounted}")
+            assert stored == recounted == (expected_members, expected_posts)
+
+        def check_post(post_id, expected_likes, expected_comments):
+            db.session.expire_all()
+            post = db.session.get(CommunityPost, post_id)
+            stored = (post.likes_count, post.comments_count)
+            post.update_engagement_stats()
+            recounted = (post.likes_count, post.comments_count)
+            db.session.rollback()
+            print(f"   likes/comments stored {stored}, recounted {recounted}")
+            assert stored == recounted == (expected_likes, expected_comments)
+
+        check_community(1, 0)
+
+        # Join, leave and rejoin
+        assert CommunityService.join_community(member.id, community_id)['success']
+        check_community(2, 0)
+        assert CommunityService.leave_community(member.id, community_id)['success']
+        check_community(1, 0)
+        assert CommunityService.join_community(member.id, community_id)['success']
+        check_community(2, 0)
+
+        result = CommunityService.create_post(member.id, community_id, 'Counter post')
+        assert result['success'], result
+        post_id = result['post']['id']
+        check_community(2, 1)
+
+        # Like, unlike and like again
+        assert CommunityService.like_post(owner.id, post_id)['likes_count'] == 1
+        check_post(post_id, 1, 0)
+        assert CommunityService.like_post(owner.id, post_id)['likes_count'] == 0
+        check_post(post_id, 0, 0)
+        assert CommunityService.like_post(owner.id, post_id)['likes_count'] == 1
+        check_post(post_id, 1, 0)
+
+        # A comment and a reply both count on the post; the reply on its parent
+        result = CommunityService.add_comment(owner.id, post_id, 'First')
+        assert result['success'], result
+        parent_id = result['comment']['id']
+        assert CommunityService.add_comment(member.id, post_id, 'Reply', parent_id=parent_id)['success']
+        check_post(post_id, 1, 2)
+
+        db.session.expire_all()
+        parent = db.session.get(PostComment, parent_id)
+        active_replies = PostComment.query.filter_by(parent_id=parent_id, is_active=True).count()
+        print(f"   replies stored {parent.replies_count}, recounted {active_replies}")
+        assert parent.replies_count == active_replies == 1
+        print("   ✅ Counters match a fresh recount")
+
+if __name__ == "__main__":
+    test_counters_match_recount()
@@ -0,0 +1,80 @@
+"""
+Test script for the NASA POWER batch endpoint (POST /api/power-data/batch)
+
+The POWER service is stubbed, so no request leaves the machine.
+"""
+
+import sys
+import os
+from unittest import mock
+
+# Add the app directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app import create_app
+from app.routes import api_routes
+
+
+def _fake_power_data(lat, lon, start, end, parameters):
+    return {'success': True, 'data': [{'date': start, 'lat': lat, 'lon': lon}]}
+
+
+def _post_batch(client, items):
+    return client.post('/api/power-data/batch', json=items)
+
+
+def test_power_batch_api():
+    """Test zero coordinates, the item cap, per-item errors and deduplication"""
+    print("Testing NASA POWER batch endpoint...")
+
+    client = create_app().test_client()
+    item = {'lat': 0, 'lon': 0, 'start': '20240901', 'end': '20240905'}
+
+    with mock.patch.object(api_routes.PowerAPIService, 'get_power_data',
+                           side_effect=_fake_power_data) as service:
+        # Zero is a valid coordinate, not a missing one
+        response = _post_batch(client, [item])
+        body = response.get_json()
+        print(f"  Zero coordinates: {response.status_code}")
+        assert response.status_code == 200
+        assert body['count'] == 1
+        assert body['results'][0]['data'][0]['lat'] == 0.0
+
+        # Identical items share one upstream call; results keep request order
+        service.reset_mock()
+        other = {**item, 'lat': 23.7644, 'lon': 90.3897}
+        response = _post_batch(client, [item, other, item])
+        body = response.get_json()
+        print(f"  Duplicate items: {response.status_code}, upstream calls: {service.call_count}")
+        assert response.status_code == 200
+        assert service.call_count == 2
+        assert [r['data'][0]['lat'] for r in body['results']] == [0.0, 23.7644, 0.0]
+
+        # More than MAX_BATCH_POINTS items is rejected before any call
+        service.reset_mock()
+        response = _post_batch(client, [item] * (api_routes.MAX_BATCH_POINTS + 1))
+        print(f"  Oversized batch: {response.status_code}")
+        assert response.status_code == 400
+        assert 'at most' in response.get_json()['error']
+
+        # Per-item validation names the offending item
+        for bad_item, expected in (
+            ({'lat': 0, 'lon': 0, 'start': '20240901'}, 'Item 1: Missing required parameters: end'),
+            ({**item, 'start': '2024-09-01'}, 'Item 1: Start date must be in YYYYMMDD format'),
+            ({**item, 'lat': 'north'}, 'Item 1:'),
+            ('not an object', 'Item 1 must be an object'),
+        ):
+            response = _post_batch(client, [item, bad_item])
+            error = response.get_json()['error']
+            print(f"  Invalid item: {response.status_code} {error}")
+            assert response.status_code == 400
+            assert error.startswith(expected)
+
+        response = _post_batch(client, [])
+        assert response.status_code == 400
+        assert service.call_count == 0
+
+    print("✅ Batch endpoint checks passed")
+
+if __name__ == "__main__":
+    test_power_batch_api()
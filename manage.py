@@ -23,6 +23,7 @@
 """
 
 import os
+import re
 import sys
 import argparse
 import subprocess
@@ -36,6 +37,7 @@
 from datetime import datetime
 import importlib.util
 from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Import configuration manager
 try:
@@ -58,6 +60,16 @@ def get_jupyter_config(self): return {'port': 8888, 'host': 'localhost'}
 ML_PROJECT_DIR = PROJECT_ROOT / "ml-project"
 DATASET_DIR = PROJECT_ROOT / "dataset"
 
+# PM2 process names managed by this project, keyed by the --app option
+_APP_GROUPS = {
+    'all': ('nasa-space-app', 'terrapulse-team-website'),
+    'flask': ('nasa-space-app',),
+    'team': ('terrapulse-team-website',),
+}
+
+# PM2 stderr when the named process does not exist
+_NOT_FOUND_RE = re.compile(r'Process or Namespace.*not found', re.S)
+
 class Colors:
     """ANSI color codes for terminal output"""
     HEADER = '\033[95m'
@@ -1512,14 +1524,7 @@ def restart_applications(self, app='all'):
         Logger.section("Restarting NASA Space App Applications")
         
         # Define our specific applications to avoid restarting others
-        if app == 'all':
-            apps_to_restart = ['nasa-space-app', 'terrapulse-team-website']
-        elif app == 'flask':
-            apps_to_restart = ['nasa-space-app']
-        elif app == 'team':
-            apps_to_restart = ['terrapulse-team-website']
-        else:
-            apps_to_restart = []
+        apps_to_restart = _APP_GROUPS.get(app, ())
         
         success = True
         
@@ -1531,7 +1536,7 @@ def restart_applications(self, app='all'):
                 Logger.success(f"✅ {app_name} restarted successfully")
             else:
                 # Check if the app doesn't exist (which is not an error for restart in some cases)
-                if "Process or Namespace" in result.stderr and "not found" in result.stderr:
+                if _NOT_FOUND_RE.search(result.stderr):
                     Logger.warning(f"⚠️  {app_name} was not running (cannot restart)")
                     success = False
                 else:
@@ -1552,26 +1557,27 @@ def delete_applications(self, app='all'):
         Logger.section("Deleting NASA Space App Applications")
         
         # Define our specific applications to avoid deleting others
-        if app == 'all':
-            apps_to_delete = ['nasa-space-app', 'terrapulse-team-website']
-        elif app == 'flask':
-            apps_to_delete = ['nasa-space-app']
-        elif app == 'team':
-            apps_to_delete = ['terrapulse-team-website']
-        else:
-            apps_to_delete = []
+        apps_to_delete = _APP_GROUPS.get(app, ())
         
         success = True
         
-        for app_name in apps_to_delete:
-            Logger.info(f"Deleting {app_name}...")
-            result = subprocess.run(["pm2", "delete", app_name], capture_output=True, text=True)
-            
+        # Each `pm2 delete` spawns a Node process, so run them concurrently
+        with ThreadPoolExecutor(max_workers=max(len(apps_to_delete), 1)) as executor:
+            futures = {}
+            for app_name in apps_to_delete:
+                Logger.info(f"Deleting {app_name}...")
+                future = executor.submit(
+                    subprocess.run, ["pm2", "delete", app_name], capture_output=True, text=True
+                )
+                futures[future] = app_name
+            completed = [(futures[future], future.result()) for future in as_completed(futures)]
+        
+        for app_name, result in completed:
             if result.returncode == 0:
                 Logger.success(f"✅ {app_name} deleted successfully")
             else:
                 # Check if the app doesn't exist (which is not an error)
-                if "Process or Namespace" in result.stderr and "not found" in result.stderr:
+                if _NOT_FOUND_RE.search(result.stderr):
                     Logger.info(f"ℹ️  {app_name} was not running (already deleted)")
                 else:
                     Logger.error(f"❌ Failed to delete {app_name}: {result.stderr}")